@@ -3,13 +3,23 @@ Author research toolkit for investigating unknown accessibility experts.
 This tool helps research potential expert authors found in the collection.
 """
 
+import io
 import sys
 import json
 import re
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from pathlib import Path
-from typing import Dict, List, Optional, Set
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Tuple
+from collections import Counter
+from functools import lru_cache
+from dataclasses import dataclass, field
 from urllib.parse import quote
 
 # Add src to Python path
@@ -17,14 +27,65 @@ sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from config.constants import EXPERT_AUTHORS, AuthorityLevel
 
+# Tokenizer and W3C indicator set, built once at import time. Single-word
+# indicators become O(1) set-intersection tests against the tokenized text;
+# only the one multi-word phrase still needs a substring check.
+_TOKEN_RE = re.compile(r'[a-z0-9]+')
+_W3C_TOKENS = frozenset(('w3c', 'wcag', 'wai'))
+
+# Value-to-member table: a dict hit is much cheaper than routing every
+# stored integer back through the enum metaclass call.
+_AUTH_BY_VALUE = {level.value: level for level in AuthorityLevel}
+
+# Authority levels that qualify an author for the expert database
+_HIGH_AUTHORITY = frozenset((AuthorityLevel.NORMATIVE, AuthorityLevel.EXPERT_INTERPRETIVE))
+
+# Organization and keyword constants, hoisted to module scope as immutable
+# structures so every researcher instance shares one interned copy instead
+# of rebuilding mutable dicts and lists per constructor call.
+_ACCESSIBILITY_ORGS: Dict[str, Tuple[str, ...]] = {
+    "W3C": ("w3.org", "w3c"),
+    "WebAIM": ("webaim.org",),
+    "Deque": ("deque.com",),
+    "TPG": ("paciellogroup.com", "tpg"),
+    "Level Access": ("levelaccess.com",),
+    "UsableNet": ("usablenet.com",),
+    "IAAP": ("accessibilityassociation.org",),
+}
+
+_ACCESSIBILITY_KEYWORDS: Tuple[str, ...] = (
+    "accessibility", "WCAG", "ARIA", "screen reader", "inclusive design",
+    "universal design", "digital accessibility", "web accessibility",
+    "a11y", "Section 508", "ADA compliance", "assistive technology",
+)
+
+# All organization keywords combined into a single alternation with one
+# named group per organization: each affiliation is scanned exactly once
+# and every hit names its organization via match.lastgroup, so no keyword
+# lookup is needed per match. Group names must be identifiers, hence the
+# sanitized-name table back to the display names.
+_ORG_GROUP_NAMES: Dict[str, str] = {
+    re.sub(r'\W', '_', org): org for org in _ACCESSIBILITY_ORGS
+}
+_ORG_KW_REGEX = re.compile(
+    '|'.join(
+        '(?P<{}>{})'.format(
+            re.sub(r'\W', '_', org),
+            '|'.join(sorted(map(re.escape, keywords), key=len, reverse=True))
+        )
+        for org, keywords in _ACCESSIBILITY_ORGS.items()
+    ),
+    re.IGNORECASE
+)
+
 
-@dataclass
+@dataclass(slots=True)
 class AuthorResearchProfile:
     """Research profile for an author."""
     name: str
     document_count: int
     sample_titles: List[str]
-    potential_affiliations: Set[str]
+    potential_affiliations: Tuple[str, ...]
     expertise_areas: List[str]
     
     # Research findings
@@ -33,130 +94,238 @@ class AuthorResearchProfile:
     personal_website: Optional[str] = None
     current_affiliation: Optional[str] = None
     w3c_involvement: bool = False
-    accessibility_credentials: List[str] = None
+    accessibility_credentials: List[str] = field(default_factory=list)
     recommended_authority: AuthorityLevel = AuthorityLevel.UNKNOWN
     research_notes: str = ""
     research_status: str = "pending"  # "pending", "completed", "skip"
 
 
+def _unstructure_profile(profile: AuthorResearchProfile) -> Dict:
+    """Flatten a profile to JSON-ready values in one straight-line pass.
+
+    Replaces the recursive asdict() walk: enums become their values and
+    the affiliation set becomes a sorted list, so the result serializes
+    without per-call reflection over dataclass fields.
+    """
+    return {
+        "name": profile.name,
+        "document_count": profile.document_count,
+        "sample_titles": list(profile.sample_titles),
+        "potential_affiliations": sorted(profile.potential_affiliations),
+        "expertise_areas": list(profile.expertise_areas),
+        "linkedin_url": profile.linkedin_url,
+        "twitter_url": profile.twitter_url,
+        "personal_website": profile.personal_website,
+        "current_affiliation": profile.current_affiliation,
+        "w3c_involvement": profile.w3c_involvement,
+        "accessibility_credentials": list(profile.accessibility_credentials or []),
+        "recommended_authority": profile.recommended_authority.value,
+        "research_notes": profile.research_notes,
+        "research_status": profile.research_status,
+    }
+
+
+@lru_cache(maxsize=4096)
+def _score_author(
+    sample_titles: Tuple[str, ...],
+    expertise_areas: Tuple[str, ...],
+    affiliations: Tuple[str, ...],
+    document_count: int,
+    w3c_prior: bool = False,
+) -> Tuple[bool, AuthorityLevel, Optional[str], Tuple[str, ...], str]:
+    """Heuristic scoring kernel, memoized on its hashable signature.
+
+    Identical author inputs always produce identical findings, so repeat
+    runs over overlapping author sets skip the text scans entirely. The
+    cache is module-level and therefore survives across batches.
+    """
+    # Lowercase once and tokenize once, then reuse both for every check
+    all_text = ' '.join(sample_titles + expertise_areas).lower()
+    tokens = frozenset(_TOKEN_RE.findall(all_text))
+
+    # Notes accumulate in a local list and are joined once at the end;
+    # repeated += on the string reallocates it on every append
+    notes = []
+
+    # Check for W3C involvement indicators
+    w3c_involvement = w3c_prior
+    if tokens & _W3C_TOKENS or 'working group' in all_text:
+        w3c_involvement = True
+        notes.append("Potential W3C involvement based on content. ")
+
+    # Estimate authority level based on expertise breadth and document
+    # count. The thresholds are the integer equivalents of the old
+    # normalized score (count / 10 against 0.5 and 0.3), so the cascade
+    # runs on plain integer comparisons with no float division.
+    expertise_score = len(expertise_areas)
+
+    if w3c_involvement and expertise_score >= 3:
+        authority = AuthorityLevel.NORMATIVE
+        notes.append("High authority due to W3C involvement and broad expertise. ")
+    elif expertise_score >= 3 and document_count > 5:
+        authority = AuthorityLevel.EXPERT_INTERPRETIVE
+        notes.append("Expert level due to broad accessibility expertise. ")
+    elif document_count > 3:
+        authority = AuthorityLevel.PROFESSIONAL
+        notes.append("Professional level based on publication count. ")
+    else:
+        authority = AuthorityLevel.COMMUNITY
+
+    # Check for known affiliations: one sweep per affiliation, with
+    # duplicate keyword hits for the same organization collapsed while
+    # preserving first-match order
+    current_affiliation = None
+    credentials = []
+    for affiliation in affiliations:
+        matched_orgs = dict.fromkeys(
+            _ORG_GROUP_NAMES[match.lastgroup]
+            for match in _ORG_KW_REGEX.finditer(affiliation)
+        )
+        for org in matched_orgs:
+            current_affiliation = f"{org} ({affiliation})"
+            credentials.append(org)
+            notes.append(f"Affiliated with {org}. ")
+
+            # Boost authority for known accessibility organizations
+            if authority.value < AuthorityLevel.EXPERT_INTERPRETIVE.value:
+                authority = AuthorityLevel.EXPERT_INTERPRETIVE
+
+    return w3c_involvement, authority, current_affiliation, tuple(credentials), ''.join(notes)
+
+
 class AuthorResearcher:
     """Tools for researching potential accessibility experts."""
     
+    accessibility_organizations = _ACCESSIBILITY_ORGS
+    accessibility_keywords = _ACCESSIBILITY_KEYWORDS
+
     def __init__(self):
-        self.accessibility_organizations = {
-            "W3C": ["w3.org", "w3c"],
-            "WebAIM": ["webaim.org"],
-            "Deque": ["deque.com"],
-            "TPG": ["paciellogroup.com", "tpg"],
-            "Level Access": ["levelaccess.com"],
-            "UsableNet": ["usablenet.com"],
-            "IAAP": ["accessibilityassociation.org"]
-        }
-        
-        self.accessibility_keywords = [
-            "accessibility", "WCAG", "ARIA", "screen reader", "inclusive design",
-            "universal design", "digital accessibility", "web accessibility",
-            "a11y", "Section 508", "ADA compliance", "assistive technology"
-        ]
+        # One pooled session shared across the batch: keep-alive reuses
+        # connections so per-author lookups against the same hosts
+        # (LinkedIn, Google Scholar, W3C) skip repeated TCP/TLS setup
+        self._http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+        self._http.mount('https://', adapter)
+        self._http.mount('http://', adapter)
     
     def research_author_batch(self, author_research_file: str) -> Dict:
         """Process a batch of authors for research."""
         try:
-            with open(author_research_file, 'r', encoding='utf-8') as f:
-                research_data = json.load(f)
+            # Read the raw bytes once; orjson parses them in a single pass
+            # and is several times faster than the stdlib decoder
+            with open(author_research_file, 'rb') as f:
+                raw = f.read()
+            research_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
         except FileNotFoundError:
             print(f"Research file not found: {author_research_file}")
             return {}
-        
-        # Process high priority authors first
+
+        # Process high priority authors first. Research is I/O-bound once
+        # real lookups are wired in, so the per-author work fans out over a
+        # thread pool; each call touches only its own profile.
         print("Researching high priority authors...")
-        for author_data in research_data.get("high_priority_authors", []):
-            profile = self._create_research_profile(author_data)
-            enhanced_profile = self._research_single_author(profile)
-            author_data.update(asdict(enhanced_profile))
+        high_priority = research_data.get("high_priority_authors", [])
+        if high_priority:
+            profiles = [self._create_research_profile(a) for a in high_priority]
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                enhanced = list(executor.map(self._research_single_author, profiles))
+            for author_data, enhanced_profile in zip(high_priority, enhanced):
+                author_data.update(_unstructure_profile(enhanced_profile))
         
-        # Save updated research data
+        # Save updated research data; orjson emits UTF-8 bytes directly in
+        # one shot, so the file is opened in binary mode on that path
         output_file = "author_research_results.json"
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(research_data, f, indent=2, ensure_ascii=False)
-        
+        if orjson is not None:
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(research_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                json.dump(research_data, f, indent=2, ensure_ascii=False)
+
         return research_data
     
     def generate_research_report(self, research_results: Dict) -> str:
         """Generate a research report for manual review."""
-        report = []
-        report.append("# Author Research Report")
-        report.append("=" * 50)
+        # Write straight into a string buffer instead of accumulating a list
+        # of fragments and joining at the end
+        buf = io.StringIO()
+
+        def w(line: str) -> None:
+            buf.write(line)
+            buf.write('\n')
+
+        w("# Author Research Report")
+        w("=" * 50)
         
-        # High priority findings
+        # High priority findings. Resolve each author's recommended
+        # authority once up front; the tally, the action-item filter and
+        # the name lines below all reuse the cached member.
         high_priority = research_results.get("high_priority_authors", [])
+        for author in high_priority:
+            author["_auth"] = _AUTH_BY_VALUE[author.get("recommended_authority", 0)]
         if high_priority:
-            report.append("\n## 🔍 HIGH PRIORITY RESEARCH RESULTS")
-            report.append("-" * 40)
+            w("\n## 🔍 HIGH PRIORITY RESEARCH RESULTS")
+            w("-" * 40)
             
+            # The report only reads fields, so it works off the author
+            # dicts directly instead of rebuilding a profile per author
             for author in high_priority:
-                profile = AuthorResearchProfile(**author)
-                report.append(f"\n### {profile.name}")
-                report.append(f"**Documents**: {profile.document_count}")
-                report.append(f"**Sample Work**: {profile.sample_titles[0] if profile.sample_titles else 'N/A'}")
-                
-                if profile.current_affiliation:
-                    report.append(f"**Current Role**: {profile.current_affiliation}")
-                
-                if profile.w3c_involvement:
-                    report.append("**W3C Involvement**: ✅ Yes")
-                
-                if profile.accessibility_credentials:
-                    report.append(f"**Credentials**: {', '.join(profile.accessibility_credentials)}")
-                
-                report.append(f"**Recommended Authority**: {profile.recommended_authority.value}")
-                
-                if profile.research_notes:
-                    report.append(f"**Research Notes**: {profile.research_notes}")
-                
+                w(f"\n### {author['name']}")
+                w(f"**Documents**: {author['document_count']}")
+                sample_titles = author.get("sample_titles") or []
+                w(f"**Sample Work**: {sample_titles[0] if sample_titles else 'N/A'}")
+
+                if author.get("current_affiliation"):
+                    w(f"**Current Role**: {author['current_affiliation']}")
+
+                if author.get("w3c_involvement"):
+                    w("**W3C Involvement**: ✅ Yes")
+
+                credentials = author.get("accessibility_credentials") or []
+                if credentials:
+                    w(f"**Credentials**: {', '.join(credentials)}")
+
+                w(f"**Recommended Authority**: {author['_auth'].value}")
+
+                if author.get("research_notes"):
+                    w(f"**Research Notes**: {author['research_notes']}")
+
                 # Links for manual verification
                 links = []
-                if profile.linkedin_url:
-                    links.append(f"[LinkedIn]({profile.linkedin_url})")
-                if profile.twitter_url:
-                    links.append(f"[Twitter]({profile.twitter_url})")
-                if profile.personal_website:
-                    links.append(f"[Website]({profile.personal_website})")
+                if author.get("linkedin_url"):
+                    links.append(f"[LinkedIn]({author['linkedin_url']})")
+                if author.get("twitter_url"):
+                    links.append(f"[Twitter]({author['twitter_url']})")
+                if author.get("personal_website"):
+                    links.append(f"[Website]({author['personal_website']})")
                 
                 if links:
-                    report.append(f"**Links**: {' | '.join(links)}")
+                    w(f"**Links**: {' | '.join(links)}")
                 
-                report.append("")
+                w("")
         
         # Summary and recommendations
-        report.append("\n## 📋 SUMMARY & RECOMMENDATIONS")
-        report.append("-" * 40)
+        w("\n## 📋 SUMMARY & RECOMMENDATIONS")
+        w("-" * 40)
         
         # Count recommendations by authority level
-        authority_counts = {}
-        for author in high_priority:
-            auth_level = AuthorityLevel(author.get("recommended_authority", 0))
-            authority_counts[auth_level] = authority_counts.get(auth_level, 0) + 1
+        authority_counts = Counter(author["_auth"] for author in high_priority)
         
-        report.append(f"**Total Authors Researched**: {len(high_priority)}")
+        w(f"**Total Authors Researched**: {len(high_priority)}")
         for auth_level, count in authority_counts.items():
             if count > 0:
-                report.append(f"**{auth_level.name}**: {count} authors")
+                w(f"**{auth_level.name}**: {count} authors")
         
         # Action items
-        report.append("\n### 🎯 RECOMMENDED ACTIONS")
-        experts_to_add = [a for a in high_priority 
-                         if AuthorityLevel(a.get("recommended_authority", 0)) in [
-                             AuthorityLevel.NORMATIVE, 
-                             AuthorityLevel.EXPERT_INTERPRETIVE
-                         ]]
-        
+        w("\n### 🎯 RECOMMENDED ACTIONS")
+        experts_to_add = [a for a in high_priority if a["_auth"] in _HIGH_AUTHORITY]
+
         if experts_to_add:
-            report.append(f"1. **Add {len(experts_to_add)} new experts** to the expert database")
+            w(f"1. **Add {len(experts_to_add)} new experts** to the expert database")
             for expert in experts_to_add[:5]:
-                report.append(f"   - {expert['name']} ({AuthorityLevel(expert['recommended_authority']).name})")
+                w(f"   - {expert['name']} ({expert['_auth'].name})")
         
-        return "\n".join(report)
+        return buf.getvalue()[:-1]
     
     def generate_expert_database_update(self, research_results: Dict) -> Dict:
         """Generate updated expert database entries."""
@@ -164,10 +333,11 @@ class AuthorResearcher:
         
         high_priority = research_results.get("high_priority_authors", [])
         for author in high_priority:
-            auth_level = AuthorityLevel(author.get("recommended_authority", 0))
-            
+            # Reuse the member resolved during report generation when present
+            auth_level = author.get("_auth") or _AUTH_BY_VALUE[author.get("recommended_authority", 0)]
+
             # Only include experts with high authority
-            if auth_level in [AuthorityLevel.NORMATIVE, AuthorityLevel.EXPERT_INTERPRETIVE]:
+            if auth_level in _HIGH_AUTHORITY:
                 new_experts[author["name"]] = {
                     "authority": auth_level.value,
                     "expertise": author.get("expertise_areas", []),
@@ -184,7 +354,9 @@ class AuthorResearcher:
             name=author_data["name"],
             document_count=author_data["document_count"],
             sample_titles=author_data.get("sample_titles", []),
-            potential_affiliations=set(author_data.get("affiliations", [])),
+            # dict.fromkeys dedupes while keeping order, without hashing
+            # the strings into a set the downstream scan never probes
+            potential_affiliations=tuple(dict.fromkeys(author_data.get("affiliations", []))),
             expertise_areas=author_data.get("expertise_indicators", []),
             accessibility_credentials=[]
         )
@@ -196,6 +368,8 @@ class AuthorResearcher:
         # 2. Google Scholar searches
         # 3. W3C member directory checks
         # 4. Social media presence analysis
+        # Any HTTP lookups should go through self._http so the whole batch
+        # shares the pooled, keep-alive session.
         
         # For now, provide heuristic analysis
         profile = self._analyze_author_heuristically(profile)
@@ -203,43 +377,23 @@ class AuthorResearcher:
     
     def _analyze_author_heuristically(self, profile: AuthorResearchProfile) -> AuthorResearchProfile:
         """Analyze author using heuristic methods."""
-        # Analyze based on document titles and expertise areas
-        all_text = ' '.join(profile.sample_titles + profile.expertise_areas).lower()
-        
-        # Check for W3C involvement indicators
-        if any(term in all_text for term in ['w3c', 'wcag', 'wai', 'working group']):
-            profile.w3c_involvement = True
-            profile.research_notes += "Potential W3C involvement based on content. "
-        
-        # Estimate authority level based on expertise breadth and document count
-        expertise_score = len(profile.expertise_areas)
-        doc_score = min(profile.document_count / 10, 1.0)  # Normalize to 0-1
-        
-        if profile.w3c_involvement and expertise_score >= 3:
-            profile.recommended_authority = AuthorityLevel.NORMATIVE
-            profile.research_notes += "High authority due to W3C involvement and broad expertise. "
-        elif expertise_score >= 3 and doc_score > 0.5:
-            profile.recommended_authority = AuthorityLevel.EXPERT_INTERPRETIVE
-            profile.research_notes += "Expert level due to broad accessibility expertise. "
-        elif doc_score > 0.3:
-            profile.recommended_authority = AuthorityLevel.PROFESSIONAL
-            profile.research_notes += "Professional level based on publication count. "
-        else:
-            profile.recommended_authority = AuthorityLevel.COMMUNITY
-        
-        # Check for known affiliations
-        for affiliation in profile.potential_affiliations:
-            affiliation_lower = affiliation.lower()
-            for org, keywords in self.accessibility_organizations.items():
-                if any(keyword in affiliation_lower for keyword in keywords):
-                    profile.current_affiliation = f"{org} ({affiliation})"
-                    profile.accessibility_credentials.append(org)
-                    profile.research_notes += f"Affiliated with {org}. "
-                    
-                    # Boost authority for known accessibility organizations
-                    if profile.recommended_authority.value < AuthorityLevel.EXPERT_INTERPRETIVE.value:
-                        profile.recommended_authority = AuthorityLevel.EXPERT_INTERPRETIVE
-        
+        # The scoring itself is a pure, memoized function of the profile's
+        # hashable signature, so re-runs over overlapping author sets reuse
+        # cached results instead of re-scanning the same text
+        w3c_involvement, authority, current_affiliation, credentials, notes = _score_author(
+            tuple(profile.sample_titles),
+            tuple(profile.expertise_areas),
+            tuple(sorted(profile.potential_affiliations)),
+            profile.document_count,
+            profile.w3c_involvement,
+        )
+
+        profile.w3c_involvement = w3c_involvement
+        profile.recommended_authority = authority
+        if current_affiliation:
+            profile.current_affiliation = current_affiliation
+        profile.accessibility_credentials.extend(credentials)
+        profile.research_notes = profile.research_notes + notes
         profile.research_status = "automated_analysis"
         return profile
 
@@ -247,8 +401,9 @@ class AuthorResearcher:
 def create_manual_research_template(author_research_file: str) -> str:
     """Create a template for manual research."""
     try:
-        with open(author_research_file, 'r', encoding='utf-8') as f:
-            research_data = json.load(f)
+        with open(author_research_file, 'rb') as f:
+            raw = f.read()
+        research_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
     except FileNotFoundError:
         print(f"Research file not found: {author_research_file}")
         return ""
@@ -291,7 +446,8 @@ def create_manual_research_template(author_research_file: str) -> str:
     
     # Save template
     template_file = "MANUAL_RESEARCH_TEMPLATE.md"
-    with open(template_file, 'w', encoding='utf-8') as f:
+    # A wide buffer lets the joined template leave in one write syscall
+    with open(template_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
         f.write('\n'.join(template))
     
     return template_file
@@ -315,13 +471,20 @@ def main():
     
     # Generate reports
     report = researcher.generate_research_report(results)
-    with open("AUTHOR_RESEARCH_REPORT.md", 'w', encoding='utf-8') as f:
+    with open("AUTHOR_RESEARCH_REPORT.md", 'w', encoding='utf-8', buffering=1 << 20) as f:
         f.write(report)
     
     # Generate expert database updates
     new_experts = researcher.generate_expert_database_update(results)
-    with open("new_experts_to_add.json", 'w', encoding='utf-8') as f:
-        json.dump(new_experts, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        # One serialized blob, one write; sorted keys keep diffs stable
+        with open("new_experts_to_add.json", 'wb') as f:
+            f.write(orjson.dumps(
+                new_experts, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+            ))
+    else:
+        with open("new_experts_to_add.json", 'w', encoding='utf-8') as f:
+            json.dump(new_experts, f, indent=2, ensure_ascii=False, sort_keys=True)
     
     # Create manual research template
     template_file = create_manual_research_template(research_file)
@@ -2,20 +2,269 @@
 Tool for discovering and cataloguing authoritative accessibility blogs and sources.
 """
 
+import io
+import os
 import sys
 import json
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Set, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from collections import defaultdict, Counter
 from urllib.parse import urlparse
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add src to Python path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from config.constants import EXPERT_AUTHORS
 
+# Patterns compiled once at import time; they run per document inside the
+# discovery loop, so each call is a direct match instead of a trip through
+# the re module's pattern cache.
+_URL_RE = re.compile(r'https?://([^/\s]+)')
+_URL_FULL_RE = re.compile(r'https?://[^\s]+')
+
+# Common blog patterns for extracting a source name without a URL
+_BLOG_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'(\w+\.com)\s+blog',
+    r'blog\.(\w+\.com)',
+    r'(\w+)\s+blog',
+    r'medium\.com/@(\w+)',
+    r'dev\.to/(\w+)',
+)]
+
+# Blog indicators folded into one alternation: a single C-level scan of the
+# combined text replaces one Python substring check per indicator
+_BLOG_INDICATORS = (
+    'blog', 'medium.com', 'dev.to', 'smashingmagazine.com',
+    'css-tricks.com', 'a11yproject.com', 'webaim.org/blog',
+    'deque.com/blog', 'adrianroselli.com', 'scottohara.me'
+)
+_BLOG_INDICATOR_RE = re.compile('|'.join(map(re.escape, _BLOG_INDICATORS)))
+
+# Guard literals for the pre-filter in _is_blog_content: every indicator
+# contains one of these fragments, so text containing none of them cannot
+# match the alternation. Checked here so an indicator added without a
+# covering guard fails at import instead of being silently filtered out.
+_BLOG_GUARDS = ('blog', '.com', '.to', '.me')
+for _indicator in _BLOG_INDICATORS:
+    if not any(_guard in _indicator for _guard in _BLOG_GUARDS):
+        raise ValueError(f"blog indicator {_indicator!r} not covered by guards")
+
+# Content focus areas and the keywords that signal them; the reverse
+# keyword->focus map and combined alternation let one scan of a document
+# resolve every focus area instead of testing each keyword separately
+_FOCUS_MAPPING = {
+    "WCAG": ["wcag", "guidelines", "standards"],
+    "ARIA": ["aria", "roles", "properties"],
+    "Testing": ["testing", "audit", "evaluation"],
+    "Screen Readers": ["screen reader", "nvda", "jaws", "voiceover"],
+    "Keyboard Navigation": ["keyboard", "navigation", "focus"],
+    "Color/Contrast": ["color", "contrast", "vision"],
+    "Forms": ["form", "input", "label"],
+    "JavaScript": ["javascript", "js", "dynamic", "spa"],
+    "Design": ["design", "ux", "ui", "inclusive"]
+}
+_KW_TO_FOCUS = {kw: focus
+                for focus, kws in _FOCUS_MAPPING.items()
+                for kw in kws}
+_FOCUS_KW_RE = re.compile(
+    '|'.join(sorted(map(re.escape, _KW_TO_FOCUS), key=len, reverse=True))
+)
+
+# Terms that mark accessibility-focused content
+_ACCESSIBILITY_INDICATORS = [
+    "accessibility", "a11y", "wcag", "aria", "screen reader",
+    "inclusive design", "universal design", "assistive technology",
+    "keyboard navigation", "color contrast", "focus management"
+]
+
+# Single-word accessibility terms resolve against a token set in one
+# intersection; only the multi-word phrases still need a text scan
+_WORD_RE = re.compile(r'[a-z0-9]+')
+_A11Y_TOKENS = frozenset(
+    term for term in _ACCESSIBILITY_INDICATORS if ' ' not in term
+)
+_A11Y_PHRASE_RE = re.compile('|'.join(
+    re.escape(term) for term in _ACCESSIBILITY_INDICATORS if ' ' in term
+))
+
+# Organization markers are whole words in practice, so they are matched
+# as tokens rather than substrings
+_ORG_TOKENS = frozenset(('webaim', 'deque', 'tpg', 'paciello', 'w3c'))
+
+# All expert names folded into one alternation so the author field is
+# scanned once per document instead of once per expert; matches map back
+# to canonical casing for the indicator text
+_EXPERT_CANONICAL = {name.lower(): name for name in EXPERT_AUTHORS}
+_EXPERT_RE = re.compile(
+    '|'.join(re.escape(name) for name in
+             sorted(_EXPERT_CANONICAL, key=len, reverse=True)),
+    re.IGNORECASE
+)
+
+# Below this many documents the process-pool startup costs more than the
+# scan itself, so smaller collections stay on the serial path
+_PARALLEL_THRESHOLD = 5000
+
+
+def _is_blog_content(combined_lc: str) -> bool:
+    """Determine if content appears to be from a blog.
+
+    Takes the pre-lowercased reference-plus-title text so the caller's
+    single .lower() serves every helper.
+    """
+    # Every indicator contains one of the guard fragments, so a few cheap
+    # substring checks reject the bulk of academic records before the
+    # indicator alternation runs without changing what it can match
+    if not any(guard in combined_lc for guard in _BLOG_GUARDS):
+        return False
+    return _BLOG_INDICATOR_RE.search(combined_lc) is not None
+
+
+def _extract_blog_source(acm_ref: str) -> Optional[str]:
+    """Extract blog source name from ACM reference."""
+    # Try to extract from URL first; the substring check skips the
+    # regex entirely for references without a scheme
+    if '://' in acm_ref:
+        url_match = _URL_RE.search(acm_ref)
+        if url_match:
+            domain = url_match.group(1)
+            # Clean up domain
+            return domain.removeprefix('www.')
+
+    # Try to extract from common blog patterns; every pattern needs
+    # one of these markers, so references without them skip the loop
+    acm_lc = acm_ref.lower()
+    if 'blog' in acm_lc or 'medium.com' in acm_lc or 'dev.to' in acm_lc:
+        for pattern in _BLOG_PATTERNS:
+            match = pattern.search(acm_ref)
+            if match:
+                return match.group(1)
+
+    # Fallback: use first significant word
+    words = acm_ref.split()
+    for word in words:
+        if len(word) > 3 and word.lower() not in ['http', 'https', 'www']:
+            return word
+
+    return None
+
+
+def _extract_url(acm_ref: str) -> Optional[str]:
+    """Extract URL from ACM reference."""
+    url_match = _URL_FULL_RE.search(acm_ref)
+    return url_match.group(0) if url_match else None
+
+
+def _analyze_authority_indicators(authors_lc: str, acm_lc: str, combined_lc: str) -> List[str]:
+    """Analyze authority indicators for a blog source.
+
+    All arguments arrive pre-lowercased from the discovery loop.
+    """
+    indicators = []
+
+    # Check for known experts
+    for match in _EXPERT_RE.finditer(authors_lc):
+        expert = _EXPERT_CANONICAL[match.group(0)]
+        indicator = f"Known expert: {expert}"
+        if indicator not in indicators:
+            indicators.append(indicator)
+
+    # Check for accessibility organization affiliation: tokenize the
+    # reference once and intersect with the org vocabulary
+    acm_tokens = set(_WORD_RE.findall(acm_lc))
+    for org in acm_tokens & _ORG_TOKENS:
+        indicators.append(f"Organization: {org}")
+
+    # Check for accessibility focus: single-word terms via one token-set
+    # intersection, multi-word phrases via one combined scan
+    tokens = set(_WORD_RE.findall(f"{authors_lc} {combined_lc}"))
+    if (tokens & _A11Y_TOKENS
+            or _A11Y_PHRASE_RE.search(combined_lc)
+            or _A11Y_PHRASE_RE.search(authors_lc)):
+        indicators.append("Accessibility focused")
+
+    return indicators
+
+
+def _analyze_content_focus(combined_lc: str) -> List[str]:
+    """Analyze the content focus areas of pre-lowercased text."""
+    return list({_KW_TO_FOCUS[m.group(0)]
+                 for m in _FOCUS_KW_RE.finditer(combined_lc)})
+
+
+def _accumulate_documents(doc_infos: List[Dict]):
+    """Scan a batch of documents and return per-source accumulators.
+
+    A pure module-level function, so worker processes pickle only the
+    batch of records rather than a whole tool instance.
+    """
+    # Parallel per-field accumulators: a plain string-keyed lookup per
+    # field is cheaper than a nested dict rebuilt by a lambda factory,
+    # and each field keeps its natural container type
+    counts = Counter()
+    authors_by = defaultdict(set)
+    # Only the first three titles and one URL per source ever reach the
+    # report, so cap what is stored instead of keeping every entry
+    titles_by = defaultdict(list)
+    url_by = {}
+    # Indicators and focus areas are deduplicated at the end anyway, so
+    # accumulate them as sets and skip the extend-then-set() round trip
+    authority_by = defaultdict(set)
+    focus_by = defaultdict(set)
+
+    # Analyze each document for blog indicators
+    for doc_info in doc_infos:
+        acm_ref = doc_info.get('acm_reference', '')
+        title = doc_info.get('title', '')
+        authors = doc_info.get('authors', '')
+
+        # Nothing to scan for records with no reference and no title
+        if not acm_ref and not title:
+            continue
+
+        # Lowercase each field exactly once per document; every helper
+        # below works off these shared strings
+        acm_lc = acm_ref.lower()
+        combined_lc = f"{acm_lc} {title.lower()}"
+
+        # Check if this looks like a blog post
+        if _is_blog_content(combined_lc):
+            source_name = _extract_blog_source(acm_ref)
+            if source_name:
+                counts[source_name] += 1
+                authors_by[source_name].add(authors)
+                titles = titles_by[source_name]
+                if len(titles) < 3:
+                    titles.append(title)
+
+                # Keep the first URL seen for the source
+                if source_name not in url_by:
+                    url = _extract_url(acm_ref)
+                    if url:
+                        url_by[source_name] = url
+
+                # Analyze authority indicators
+                authority_by[source_name].update(
+                    _analyze_authority_indicators(
+                        authors.lower(), acm_lc, combined_lc
+                    )
+                )
+
+                # Analyze content focus
+                focus_by[source_name].update(
+                    _analyze_content_focus(combined_lc)
+                )
+
+    return counts, authors_by, titles_by, url_by, authority_by, focus_by
+
 
 @dataclass
 class BlogSource:
@@ -30,6 +279,24 @@ class BlogSource:
     sample_titles: List[str]
     notes: str = ""
 
+    def to_dict(self) -> Dict:
+        """Flatten to plain JSON-serializable types.
+
+        Straight-line field copies instead of asdict()'s recursive
+        deep-copy walk; the author set becomes a list on the way out.
+        """
+        return {
+            'name': self.name,
+            'url': self.url,
+            'document_count': self.document_count,
+            'authors': list(self.authors),
+            'authority_indicators': self.authority_indicators,
+            'content_focus': self.content_focus,
+            'recommended_authority': self.recommended_authority,
+            'sample_titles': self.sample_titles,
+            'notes': self.notes,
+        }
+
 
 class BlogDiscoveryTool:
     """Tool for discovering authoritative accessibility blogs."""
@@ -56,65 +323,62 @@ class BlogDiscoveryTool:
             "heydonworks.com": {"name": "Heydon Pickering", "authority": "high"},
         }
         
-        self.accessibility_indicators = [
-            "accessibility", "a11y", "wcag", "aria", "screen reader",
-            "inclusive design", "universal design", "assistive technology",
-            "keyboard navigation", "color contrast", "focus management"
-        ]
-    
+        self.accessibility_indicators = _ACCESSIBILITY_INDICATORS
+
     def discover_blog_sources(self) -> List[BlogSource]:
         """Discover blog sources from the collection."""
         print("Discovering blog sources...")
-        
-        blog_sources = defaultdict(lambda: {
-            'count': 0,
-            'authors': set(),
-            'titles': [],
-            'urls': set(),
-            'authority_indicators': [],
-            'content_focus': []
-        })
-        
-        # Analyze each document for blog indicators
-        for doc_info in self.metadata.values():
-            acm_ref = doc_info.get('acm_reference', '')
-            title = doc_info.get('title', '')
-            authors = doc_info.get('authors', '')
-            
-            # Check if this looks like a blog post
-            if self._is_blog_content(acm_ref, title):
-                source_name = self._extract_blog_source(acm_ref)
-                if source_name:
-                    blog_sources[source_name]['count'] += 1
-                    blog_sources[source_name]['authors'].add(authors)
-                    blog_sources[source_name]['titles'].append(title)
-                    
-                    # Extract URL if present
-                    url = self._extract_url(acm_ref)
-                    if url:
-                        blog_sources[source_name]['urls'].add(url)
-                    
-                    # Analyze authority indicators
-                    authority_indicators = self._analyze_authority_indicators(authors, acm_ref, title)
-                    blog_sources[source_name]['authority_indicators'].extend(authority_indicators)
-                    
-                    # Analyze content focus
-                    content_focus = self._analyze_content_focus(title, acm_ref)
-                    blog_sources[source_name]['content_focus'].extend(content_focus)
-        
+
+        docs = list(self.metadata.values())
+        if len(docs) > _PARALLEL_THRESHOLD:
+            # Large collections: fan the scan out across cores and merge
+            # the per-source accumulators, which is associative
+            workers = os.cpu_count() or 1
+            per_chunk = -(-len(docs) // workers)
+            slices = [docs[i:i + per_chunk]
+                      for i in range(0, len(docs), per_chunk)]
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                partials = list(pool.map(_accumulate_documents, slices))
+        else:
+            partials = [_accumulate_documents(docs)]
+
+        counts = Counter()
+        authors_by = defaultdict(set)
+        titles_by = defaultdict(list)
+        url_by = {}
+        authority_by = defaultdict(set)
+        focus_by = defaultdict(set)
+        for p_counts, p_authors, p_titles, p_urls, p_auth, p_focus in partials:
+            counts.update(p_counts)
+            for name, value in p_authors.items():
+                authors_by[name].update(value)
+            for name, value in p_titles.items():
+                titles_by[name].extend(value)
+            for name, value in p_urls.items():
+                url_by.setdefault(name, value)
+            for name, value in p_auth.items():
+                authority_by[name].update(value)
+            for name, value in p_focus.items():
+                focus_by[name].update(value)
+
         # Convert to BlogSource objects
         discovered_sources = []
-        for source_name, data in blog_sources.items():
-            if data['count'] >= 2:  # Only include sources with multiple posts
+        for source_name, count in counts.items():
+            if count >= 2:  # Only include sources with multiple posts
                 source = BlogSource(
                     name=source_name,
-                    url=next(iter(data['urls'])) if data['urls'] else None,
-                    document_count=data['count'],
-                    authors=data['authors'],
-                    authority_indicators=list(set(data['authority_indicators'])),
-                    content_focus=list(set(data['content_focus'])),
-                    recommended_authority=self._determine_authority_level(source_name, data),
-                    sample_titles=data['titles'][:3]
+                    url=url_by.get(source_name),
+                    document_count=count,
+                    authors=authors_by[source_name],
+                    authority_indicators=list(authority_by[source_name]),
+                    content_focus=list(focus_by[source_name]),
+                    recommended_authority=self._determine_authority_level(
+                        source_name,
+                        {'count': count,
+                         'authors': authors_by[source_name],
+                         'authority_indicators': authority_by[source_name]}
+                    ),
+                    sample_titles=titles_by[source_name][:3]
                 )
                 discovered_sources.append(source)
         
@@ -131,13 +395,13 @@ class BlogDiscoveryTool:
         }
         
         for source in blog_sources:
-            source_data = asdict(source)
+            source_data = source.to_dict()
             
             if source.recommended_authority == "high":
                 catalog["high_authority_blogs"].append(source_data)
             elif source.recommended_authority == "medium":
                 catalog["medium_authority_blogs"].append(source_data)
-            elif any(expert in str(source.authors) for expert in EXPERT_AUTHORS.keys()):
+            elif _EXPERT_RE.search(str(source.authors)):
                 catalog["expert_personal_blogs"].append(source_data)
             elif source.document_count >= 5:
                 catalog["research_needed"].append(source_data)
@@ -148,76 +412,87 @@ class BlogDiscoveryTool:
     
     def generate_blog_report(self, catalog: Dict) -> str:
         """Generate a human-readable blog discovery report."""
-        report = []
-        report.append("# Accessibility Blog Discovery Report")
-        report.append("=" * 50)
+        # Write straight into a string buffer instead of accumulating a list
+        # of fragments and joining at the end
+        buf = io.StringIO()
+
+        def w(line: str) -> None:
+            buf.write(line)
+            buf.write('\n')
+
+        w("# Accessibility Blog Discovery Report")
+        w("=" * 50)
         
         # High authority blogs
         high_auth = catalog.get("high_authority_blogs", [])
         if high_auth:
-            report.append(f"\n## 🌟 HIGH AUTHORITY BLOGS ({len(high_auth)})")
-            report.append("-" * 40)
+            w(f"\n## 🌟 HIGH AUTHORITY BLOGS ({len(high_auth)})")
+            w("-" * 40)
             for blog in high_auth:
-                report.append(f"\n### {blog['name']}")
-                report.append(f"**Documents**: {blog['document_count']}")
+                w(f"\n### {blog['name']}")
+                w(f"**Documents**: {blog['document_count']}")
                 if blog['url']:
-                    report.append(f"**URL**: {blog['url']}")
-                report.append(f"**Authority Indicators**: {', '.join(blog['authority_indicators'][:3])}")
-                report.append(f"**Content Focus**: {', '.join(blog['content_focus'][:3])}")
-                report.append(f"**Sample Title**: {blog['sample_titles'][0] if blog['sample_titles'] else 'N/A'}")
+                    w(f"**URL**: {blog['url']}")
+                w(f"**Authority Indicators**: {', '.join(blog['authority_indicators'][:3])}")
+                w(f"**Content Focus**: {', '.join(blog['content_focus'][:3])}")
+                w(f"**Sample Title**: {blog['sample_titles'][0] if blog['sample_titles'] else 'N/A'}")
         
         # Medium authority blogs
         medium_auth = catalog.get("medium_authority_blogs", [])
         if medium_auth:
-            report.append(f"\n## 📝 MEDIUM AUTHORITY BLOGS ({len(medium_auth)})")
-            report.append("-" * 40)
+            w(f"\n## 📝 MEDIUM AUTHORITY BLOGS ({len(medium_auth)})")
+            w("-" * 40)
             for blog in medium_auth:
-                report.append(f"- **{blog['name']}** ({blog['document_count']} docs)")
+                w(f"- **{blog['name']}** ({blog['document_count']} docs)")
                 if blog['url']:
-                    report.append(f"  URL: {blog['url']}")
+                    w(f"  URL: {blog['url']}")
         
         # Expert personal blogs
         expert_blogs = catalog.get("expert_personal_blogs", [])
         if expert_blogs:
-            report.append(f"\n## 👤 EXPERT PERSONAL BLOGS ({len(expert_blogs)})")
-            report.append("-" * 40)
+            w(f"\n## 👤 EXPERT PERSONAL BLOGS ({len(expert_blogs)})")
+            w("-" * 40)
             for blog in expert_blogs:
-                report.append(f"- **{blog['name']}** ({blog['document_count']} docs)")
+                w(f"- **{blog['name']}** ({blog['document_count']} docs)")
                 if blog['url']:
-                    report.append(f"  URL: {blog['url']}")
+                    w(f"  URL: {blog['url']}")
         
         # Sources needing research
         research_needed = catalog.get("research_needed", [])
         if research_needed:
-            report.append(f"\n## 🔍 SOURCES REQUIRING RESEARCH ({len(research_needed)})")
-            report.append("-" * 40)
+            w(f"\n## 🔍 SOURCES REQUIRING RESEARCH ({len(research_needed)})")
+            w("-" * 40)
             for blog in research_needed:
-                report.append(f"\n### {blog['name']} - NEEDS INVESTIGATION")
-                report.append(f"**Documents**: {blog['document_count']}")
+                w(f"\n### {blog['name']} - NEEDS INVESTIGATION")
+                w(f"**Documents**: {blog['document_count']}")
                 if blog['url']:
-                    report.append(f"**URL**: {blog['url']}")
-                report.append(f"**Authors**: {len(blog['authors'])} unique")
-                report.append(f"**Research Priority**: High (multiple documents)")
+                    w(f"**URL**: {blog['url']}")
+                w(f"**Authors**: {len(blog['authors'])} unique")
+                w(f"**Research Priority**: High (multiple documents)")
         
         # Recommendations
-        report.append(f"\n## 📋 RECOMMENDATIONS")
-        report.append("-" * 40)
+        w(f"\n## 📋 RECOMMENDATIONS")
+        w("-" * 40)
         
         total_high = len(high_auth)
         total_research = len(research_needed)
         
-        report.append(f"1. **Monitor {total_high} high-authority blogs** for new accessibility content")
-        report.append(f"2. **Research {total_research} unknown sources** to determine their authority")
-        report.append(f"3. **Consider reaching out** to expert bloggers for collaboration")
-        report.append(f"4. **Prioritize content** from high-authority sources in retrieval")
+        w(f"1. **Monitor {total_high} high-authority blogs** for new accessibility content")
+        w(f"2. **Research {total_research} unknown sources** to determine their authority")
+        w(f"3. **Consider reaching out** to expert bloggers for collaboration")
+        w(f"4. **Prioritize content** from high-authority sources in retrieval")
         
-        return "\n".join(report)
+        return buf.getvalue()[:-1]
     
     def _load_metadata(self) -> Dict:
         """Load metadata from file."""
         try:
-            with open(self.metadata_file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            # Read the whole file as bytes once; orjson parses straight
+            # from the buffer without an intermediate decode
+            raw = Path(self.metadata_file_path).read_bytes()
+            if orjson is not None:
+                return orjson.loads(raw)
+            return json.loads(raw)
         except FileNotFoundError:
             print(f"Metadata file not found: {self.metadata_file_path}")
             return {}
@@ -225,104 +500,17 @@ class BlogDiscoveryTool:
             print(f"Error loading metadata: {e}")
             return {}
     
-    def _is_blog_content(self, acm_ref: str, title: str) -> bool:
-        """Determine if content appears to be from a blog."""
-        blog_indicators = [
-            'blog', 'medium.com', 'dev.to', 'smashingmagazine.com',
-            'css-tricks.com', 'a11yproject.com', 'webaim.org/blog',
-            'deque.com/blog', 'adrianroselli.com', 'scottohara.me'
-        ]
-        
-        combined_text = f"{acm_ref} {title}".lower()
-        return any(indicator in combined_text for indicator in blog_indicators)
-    
-    def _extract_blog_source(self, acm_ref: str) -> Optional[str]:
-        """Extract blog source name from ACM reference."""
-        # Try to extract from URL first
-        url_match = re.search(r'https?://([^/\s]+)', acm_ref)
-        if url_match:
-            domain = url_match.group(1)
-            # Clean up domain
-            domain = re.sub(r'^www\.', '', domain)
-            return domain
-        
-        # Try to extract from common blog patterns
-        blog_patterns = [
-            r'(\w+\.com)\s+blog',
-            r'blog\.(\w+\.com)',
-            r'(\w+)\s+blog',
-            r'medium\.com/@(\w+)',
-            r'dev\.to/(\w+)',
-        ]
-        
-        for pattern in blog_patterns:
-            match = re.search(pattern, acm_ref, re.IGNORECASE)
-            if match:
-                return match.group(1)
-        
-        # Fallback: use first significant word
-        words = acm_ref.split()
-        for word in words:
-            if len(word) > 3 and word.lower() not in ['http', 'https', 'www']:
-                return word
-        
-        return None
-    
-    def _extract_url(self, acm_ref: str) -> Optional[str]:
-        """Extract URL from ACM reference."""
-        url_match = re.search(r'https?://[^\s]+', acm_ref)
-        return url_match.group(0) if url_match else None
-    
-    def _analyze_authority_indicators(self, authors: str, acm_ref: str, title: str) -> List[str]:
-        """Analyze authority indicators for a blog source."""
-        indicators = []
-        
-        # Check for known experts
-        for expert in EXPERT_AUTHORS.keys():
-            if expert.lower() in authors.lower():
-                indicators.append(f"Known expert: {expert}")
-        
-        # Check for accessibility organization affiliation
-        org_indicators = ['webaim', 'deque', 'tpg', 'paciello', 'w3c']
-        for org in org_indicators:
-            if org in acm_ref.lower():
-                indicators.append(f"Organization: {org}")
-        
-        # Check for accessibility focus
-        combined_text = f"{authors} {acm_ref} {title}".lower()
-        if any(term in combined_text for term in self.accessibility_indicators):
-            indicators.append("Accessibility focused")
-        
-        return indicators
-    
-    def _analyze_content_focus(self, title: str, acm_ref: str) -> List[str]:
-        """Analyze the content focus areas."""
-        focus_areas = []
-        combined_text = f"{title} {acm_ref}".lower()
-        
-        focus_mapping = {
-            "WCAG": ["wcag", "guidelines", "standards"],
-            "ARIA": ["aria", "roles", "properties"],
-            "Testing": ["testing", "audit", "evaluation"],
-            "Screen Readers": ["screen reader", "nvda", "jaws", "voiceover"],
-            "Keyboard Navigation": ["keyboard", "navigation", "focus"],
-            "Color/Contrast": ["color", "contrast", "vision"],
-            "Forms": ["form", "input", "label"],
-            "JavaScript": ["javascript", "js", "dynamic", "spa"],
-            "Design": ["design", "ux", "ui", "inclusive"]
-        }
-        
-        for focus, keywords in focus_mapping.items():
-            if any(keyword in combined_text for keyword in keywords):
-                focus_areas.append(focus)
-        
-        return focus_areas
-    
     def _determine_authority_level(self, source_name: str, data: Dict) -> str:
         """Determine authority level for a blog source."""
-        # Check against known authoritative sources
+        # Check against known authoritative sources: the common case is an
+        # exact domain, which a single dict lookup answers; the substring
+        # scan only runs for names that embed a known domain
+        name_lc = source_name.lower()
+        known = self.known_authoritative_sources.get(name_lc)
+        if known:
+            return known["authority"]
         for domain, info in self.known_authoritative_sources.items():
-            if domain in source_name.lower():
+            if domain in name_lc:
                 return info["authority"]
         
         # Check for expert authors
@@ -368,9 +556,15 @@ def main():
     # Generate catalog
     catalog = discovery_tool.generate_blog_catalog(blog_sources)
     
-    # Save catalog
-    with open("accessibility_blog_catalog.json", 'w', encoding='utf-8') as f:
-        json.dump(catalog, f, indent=2, ensure_ascii=False, default=list)
+    # Save catalog: orjson serializes to bytes in one shot, so the file
+    # write is a single buffer instead of incremental dump chunks
+    if orjson is not None:
+        with open("accessibility_blog_catalog.json", 'wb') as f:
+            f.write(orjson.dumps(catalog, option=orjson.OPT_INDENT_2,
+                                 default=list))
+    else:
+        with open("accessibility_blog_catalog.json", 'w', encoding='utf-8') as f:
+            json.dump(catalog, f, indent=2, ensure_ascii=False, default=list)
     
     # Generate report
     report = discovery_tool.generate_blog_report(catalog)
@@ -1,9 +1,14 @@
 # app.py
 
 import streamlit as st
+import math
 import os
 import logging
 import json
+import re
+import uuid
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from langchain_community.document_loaders import UnstructuredPDFLoader
 from langchain_text_splitters import RecursiveCharacterTextSplitter
@@ -23,10 +28,82 @@ logging.basicConfig(level=logging.INFO)
 DOC_PATH = "./data/3468264.3468581.pdf"
 MODEL_NAME = "llama3.1:8b"
 EMBEDDING_MODEL = "mxbai-embed-large:v1"
+# Generation cap: bounds worst-case latency and the KV-cache memory
+# Ollama reserves per request; 64K was far beyond any useful reply
+MAX_TOKENS = 1024
 VECTOR_STORE_NAME = "simple-rag"
 PERSIST_DIRECTORY = "./chroma_db"
+# HNSW build/query parameters sized for a collection in the tens of
+# thousands of chunks: true ANN search instead of Chroma's defaults
+HNSW_COLLECTION_METADATA = {
+    "hnsw:space": "cosine",
+    "hnsw:M": 32,
+    "hnsw:construction_ef": 200,
+    "hnsw:search_ef": 64,
+}
 DOCUMENTS_METADATA_FILE = "./chroma_db/documents_metadata.json"
 
+# Chunking sized to mxbai-embed-large's 512-token window using the
+# ~4-characters-per-token heuristic, with roughly 20 tokens of overlap.
+# The old 850/300 character split over-chunked with a 35% overlap and
+# inflated the number of embeddings stored and queried.
+CHUNK_SIZE = 2000
+CHUNK_OVERLAP = 80
+CHUNK_SEPARATORS = ["\n\n", "\n", ". ", " "]
+# Trailing fragments below ~100 tokens are merged into their neighbour
+MIN_CHUNK_CHARS = 400
+
+# Minimum cosine similarity for a cached answer to be reused
+SEMANTIC_CACHE_THRESHOLD = 0.92
+
+
+class SemanticCache:
+    """Cosine-similarity cache of question embeddings and responses.
+
+    Near-duplicate questions ("how do I cancel" vs "where do I stop
+    billing") short-circuit the retriever + LLM chain entirely. An
+    embedding costs orders of magnitude less than a generation, so
+    embedding every miss is effectively free.
+    """
+
+    def __init__(self, threshold=SEMANTIC_CACHE_THRESHOLD):
+        self.threshold = threshold
+        self._embeddings = []  # L2-normalized embedding tuples
+        self._entries = []     # parallel (question, response) pairs
+
+    @staticmethod
+    def _normalize(vector):
+        norm = math.sqrt(sum(x * x for x in vector))
+        if not norm:
+            return tuple(vector)
+        inv = 1.0 / norm
+        return tuple(x * inv for x in vector)
+
+    def lookup(self, embedding):
+        """Return the response cached for the closest question, or None."""
+        query = self._normalize(embedding)
+        best_score = 0.0
+        best_index = -1
+        for index, cached in enumerate(self._embeddings):
+            score = sum(a * b for a, b in zip(cached, query))
+            if score > best_score:
+                best_score = score
+                best_index = index
+        if best_index >= 0 and best_score >= self.threshold:
+            return self._entries[best_index][1]
+        return None
+
+    def add(self, embedding, question, response):
+        """Record a freshly generated answer for future lookups."""
+        self._embeddings.append(self._normalize(embedding))
+        self._entries.append((question, response))
+
+
+@st.cache_resource
+def get_semantic_cache():
+    """Semantic cache shared across Streamlit reruns."""
+    return SemanticCache()
+
 
 def ingest_pdf(doc_path, title_prefix="", authors="", acm_reference=""):
     """Load PDF documents."""
@@ -62,24 +139,114 @@ def ingest_pdf(doc_path, title_prefix="", authors="", acm_reference=""):
         return None
 
 
+def _ingest_one(args):
+    """Worker wrapper unpacking one (path, title, authors, reference) job."""
+    return ingest_pdf(*args)
+
+
+def ingest_pdfs_parallel(paths_and_meta):
+    """Load several PDFs across CPU cores.
+
+    PDF layout analysis is CPU-bound, so each (doc_path, title, authors,
+    acm_reference) job runs in its own worker process; the loaded
+    documents come back aggregated so they can be added to the vector
+    store in one batch.
+    """
+    documents = []
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+        for data in pool.map(_ingest_one, paths_and_meta):
+            if data:
+                documents.extend(data)
+    return documents
+
+
 def split_documents(documents):
     """Split documents into smaller chunks."""
-    text_splitter = RecursiveCharacterTextSplitter(chunk_size=850, chunk_overlap=300)
+    text_splitter = RecursiveCharacterTextSplitter(
+        chunk_size=CHUNK_SIZE,
+        chunk_overlap=CHUNK_OVERLAP,
+        separators=CHUNK_SEPARATORS,
+    )
     chunks = text_splitter.split_documents(documents)
+
+    # Fold undersized trailers into the preceding chunk of the same
+    # document rather than embedding them as separate near-empty vectors
+    merged = []
+    for chunk in chunks:
+        if (merged
+                and len(chunk.page_content) < MIN_CHUNK_CHARS
+                and merged[-1].metadata.get("source") == chunk.metadata.get("source")):
+            merged[-1].page_content += "\n" + chunk.page_content
+        else:
+            merged.append(chunk)
+
     logging.info("Documents split into chunks.")
-    return chunks
+    return merged
+
+
+# In-process metadata cache guarded by file mtime: nearly every helper
+# calls load_documents_metadata, and without this each Streamlit rerun
+# re-parses the JSON file once per helper. The search indexes are
+# rebuilt alongside the data whenever the file changes.
+_META_CACHE = {"mtime": None, "data": None, "search": None}
+
+_SEARCH_TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+
+def _build_search_indexes(metadata):
+    """Materialize posting lists and casefolded blobs for search_documents.
+
+    The per-document searchable text and lowered author strings are
+    folded once here instead of once per document per search call.
+    """
+    author_index = {}
+    text_index = {}
+    search_blobs = {}
+    authors_lc = {}
+    for doc_path, info in metadata.items():
+        authors = info.get('authors', '')
+        for author in authors.split(','):
+            author = author.strip().casefold()
+            if author:
+                author_index.setdefault(author, set()).add(doc_path)
+        blob = f"{info.get('title', '')} {authors} {info.get('acm_reference', '')}".casefold()
+        search_blobs[doc_path] = blob
+        authors_lc[doc_path] = authors.casefold()
+        for token in set(_SEARCH_TOKEN_RE.findall(blob)):
+            text_index.setdefault(token, set()).add(doc_path)
+    return {"author_index": author_index, "text_index": text_index,
+            "search_blobs": search_blobs, "authors_lc": authors_lc}
+
+
+def _get_search_indexes():
+    """Return the search structures, rebuilding them if the metadata changed."""
+    metadata = load_documents_metadata()
+    if _META_CACHE["search"] is None:
+        _META_CACHE["search"] = _build_search_indexes(metadata)
+    return _META_CACHE["search"]
 
 
 def load_documents_metadata():
-    """Load the documents metadata from JSON file."""
-    if os.path.exists(DOCUMENTS_METADATA_FILE):
-        try:
-            with open(DOCUMENTS_METADATA_FILE, 'r') as f:
-                return json.load(f)
-        except json.JSONDecodeError:
-            logging.warning("Invalid JSON in metadata file, starting fresh.")
-            return {}
-    return {}
+    """Load the documents metadata, reusing the cache while the file is unchanged."""
+    try:
+        mtime = os.path.getmtime(DOCUMENTS_METADATA_FILE)
+    except OSError:
+        return {}
+
+    if _META_CACHE["mtime"] == mtime:
+        return _META_CACHE["data"]
+
+    try:
+        with open(DOCUMENTS_METADATA_FILE, 'r') as f:
+            data = json.load(f)
+    except json.JSONDecodeError:
+        logging.warning("Invalid JSON in metadata file, starting fresh.")
+        return {}
+
+    _META_CACHE["mtime"] = mtime
+    _META_CACHE["data"] = data
+    _META_CACHE["search"] = None
+    return data
 
 
 def save_documents_metadata(metadata):
@@ -87,6 +254,10 @@ def save_documents_metadata(metadata):
     os.makedirs(os.path.dirname(DOCUMENTS_METADATA_FILE), exist_ok=True)
     with open(DOCUMENTS_METADATA_FILE, 'w') as f:
         json.dump(metadata, f, indent=2)
+    # Keep the cache in step with what was just written
+    _META_CACHE["mtime"] = os.path.getmtime(DOCUMENTS_METADATA_FILE)
+    _META_CACHE["data"] = metadata
+    _META_CACHE["search"] = None
 
 
 def is_document_already_added(doc_path):
@@ -108,23 +279,50 @@ def add_document_to_metadata(doc_path, title, chunks_count, authors="", acm_refe
     save_documents_metadata(metadata)
 
 
+# Chunks embedded per Ollama request; large batches amortize the HTTP
+# round trip and the server-side tokenization setup
+EMBED_BATCH_SIZE = 128
+
+
+def _add_chunks_batched(vector_db, chunks):
+    """Embed chunks in large explicit batches and add them to Chroma.
+
+    Chroma's default ingestion dispatches small embedding batches, each a
+    latency-bound round trip against the local Ollama server; batching
+    the embed_documents calls ourselves keeps the server busy per request.
+    """
+    embedding = OllamaEmbeddings(model=EMBEDDING_MODEL)
+    for start in range(0, len(chunks), EMBED_BATCH_SIZE):
+        batch = chunks[start:start + EMBED_BATCH_SIZE]
+        texts = [chunk.page_content for chunk in batch]
+        embeddings = embedding.embed_documents(texts)
+        vector_db._collection.add(
+            ids=[str(uuid.uuid4()) for _ in batch],
+            embeddings=embeddings,
+            metadatas=[chunk.metadata for chunk in batch],
+            documents=texts,
+        )
+
+
 def add_documents_to_vector_store(vector_db, documents):
     """Add new documents to an existing vector store."""
     if not documents:
         return vector_db
-    
+
     chunks = split_documents(documents)
-    vector_db.add_documents(chunks)
-    vector_db.persist()
-    
+    _add_chunks_batched(vector_db, chunks)
+
+    # Count chunks per source once instead of rescanning the whole chunk
+    # list for every document
+    chunk_counts = Counter(c.metadata.get("source", "unknown") for c in chunks)
+
     # Update metadata
     for doc in documents:
         doc_path = doc.metadata.get("source", "unknown")
         title = doc.metadata.get("title", os.path.basename(doc_path))
         authors = doc.metadata.get("authors", "")
         acm_reference = doc.metadata.get("acm_reference", "")
-        chunks_count = len([c for c in chunks if c.metadata.get("source") == doc_path])
-        add_document_to_metadata(doc_path, title, chunks_count, authors, acm_reference)
+        add_document_to_metadata(doc_path, title, chunk_counts[doc_path], authors, acm_reference)
     
     logging.info(f"Added {len(chunks)} chunks from {len(documents)} documents to vector store.")
     return vector_db
@@ -133,28 +331,64 @@ def add_documents_to_vector_store(vector_db, documents):
 def search_documents(search_term="", author_filter="", date_from="", date_to=""):
     """Search and filter documents based on various criteria."""
     metadata = load_documents_metadata()
+    if not metadata:
+        return {}
+
+    search = _get_search_indexes()
+    author_index = search["author_index"]
+    text_index = search["text_index"]
+    search_blobs = search["search_blobs"]
+    authors_lc = search["authors_lc"]
+    search_lc = search_term.casefold()
+    author_lc = author_filter.casefold()
+
+    # Narrow the candidate set with the posting lists; None means "all
+    # documents". The filters below are substring checks, so a posting
+    # set may only narrow when it provably covers every substring match:
+    # the union of postings for all index keys containing the query is
+    # such a superset, but only for queries that cannot straddle a key
+    # boundary. Queries that could straddle skip narrowing and fall back
+    # to the full scan — the substring check stays authoritative.
+    candidates = None
+    if author_lc and ',' not in author_lc and author_lc == author_lc.strip():
+        # Comma-free, unpadded filters cannot span two comma-separated
+        # author entries, so matching docs always have a matching key
+        narrowed = set()
+        for author, posting in author_index.items():
+            if author_lc in author:
+                narrowed |= posting
+        candidates = narrowed
+    if search_lc and _SEARCH_TOKEN_RE.fullmatch(search_lc):
+        # A purely alphanumeric term always sits inside a single token
+        # of any blob that contains it
+        narrowed = set()
+        for token, posting in text_index.items():
+            if search_lc in token:
+                narrowed |= posting
+        candidates = narrowed if candidates is None else candidates & narrowed
+
     filtered_docs = {}
-    
     for doc_path, info in metadata.items():
-        # Text search in title, authors, and ACM reference
-        if search_term:
-            searchable_text = f"{info.get('title', '')} {info.get('authors', '')} {info.get('acm_reference', '')}".lower()
-            if search_term.lower() not in searchable_text:
-                continue
-        
-        # Author filter
-        if author_filter and author_filter.lower() not in info.get('authors', '').lower():
+        if candidates is not None and doc_path not in candidates:
             continue
-        
-        # Date range filter
+
+        # Date range filter first — two string slices beat substring scans
         doc_date = info.get('added_at', '')[:10]  # Get YYYY-MM-DD part
         if date_from and doc_date < date_from:
             continue
         if date_to and doc_date > date_to:
             continue
-        
+
+        # Text search against the precomputed casefolded blob
+        if search_lc and search_lc not in search_blobs[doc_path]:
+            continue
+
+        # Author filter
+        if author_lc and author_lc not in authors_lc[doc_path]:
+            continue
+
         filtered_docs[doc_path] = info
-    
+
     return filtered_docs
 
 
@@ -188,17 +422,16 @@ def get_document_statistics():
     
     total_docs = len(metadata)
     total_chunks = sum(info.get('chunks_count', 0) for info in metadata.values())
-    authors = set()
-    dates = []
-    
-    for info in metadata.values():
-        if info.get('authors'):
-            # Split authors by comma and add to set
-            doc_authors = [author.strip() for author in info['authors'].split(',')]
-            authors.update(doc_authors)
-        if info.get('added_at'):
-            dates.append(info['added_at'][:10])
-    
+
+    # Generator-fed set/list builds: no per-document intermediate lists
+    authors = set(
+        author.strip()
+        for info in metadata.values() if info.get('authors')
+        for author in info['authors'].split(',')
+    )
+    dates = [info['added_at'][:10]
+             for info in metadata.values() if info.get('added_at')]
+
     date_range = (min(dates), max(dates)) if dates else None
     
     return {
@@ -210,11 +443,30 @@ def get_document_statistics():
     }
 
 
-@st.cache_resource
+# Models already pulled this process; ollama.pull round-trips to the
+# daemon even when the model is present
+_PULLED_MODELS = set()
+
+
+def _ensure_pulled(model_name):
+    """Pull an Ollama model at most once per process."""
+    if model_name not in _PULLED_MODELS:
+        ollama.pull(model_name)
+        _PULLED_MODELS.add(model_name)
+
+
 def load_vector_db():
-    """Load or create the vector database."""
+    """Load or create the vector database.
+
+    The live Chroma handle is kept in session state; it is append-safe,
+    so document adds mutate it in place instead of clearing a resource
+    cache and paying a cold re-open on the next question.
+    """
+    if "vector_db" in st.session_state:
+        return st.session_state["vector_db"]
+
     # Pull the embedding model if not already available
-    ollama.pull(EMBEDDING_MODEL)
+    _ensure_pulled(EMBEDDING_MODEL)
 
     embedding = OllamaEmbeddings(model=EMBEDDING_MODEL)
 
@@ -223,6 +475,7 @@ def load_vector_db():
             embedding_function=embedding,
             collection_name=VECTOR_STORE_NAME,
             persist_directory=PERSIST_DIRECTORY,
+            collection_metadata=HNSW_COLLECTION_METADATA,
         )
         logging.info("Loaded existing vector database.")
     else:
@@ -239,62 +492,70 @@ def load_vector_db():
             embedding=embedding,
             collection_name=VECTOR_STORE_NAME,
             persist_directory=PERSIST_DIRECTORY,
+            collection_metadata=HNSW_COLLECTION_METADATA,
         )
-        vector_db.persist()
-        
+
         # Initialize metadata
         add_document_to_metadata(DOC_PATH, "All about KAF", len(chunks))
         
         logging.info("Vector database created and persisted.")
-    return vector_db
 
+    st.session_state["vector_db"] = vector_db
+    return vector_db
 
-def get_vector_db_instance():
-    """Get the vector database instance (non-cached for updates)."""
-    ollama.pull(EMBEDDING_MODEL)
-    embedding = OllamaEmbeddings(model=EMBEDDING_MODEL)
-    
-    return Chroma(
-        embedding_function=embedding,
-        collection_name=VECTOR_STORE_NAME,
-        persist_directory=PERSIST_DIRECTORY,
-    )
 
+# Best-match relevance score below which the LLM-backed multi-query
+# retriever takes over from the direct vector search
+MULTIQUERY_FALLBACK_THRESHOLD = 0.6
 
-def create_retriever(vector_db, llm):
-    """Create a multi-query retriever."""
-    QUERY_PROMPT = PromptTemplate(
-        input_variables=["question"],
-        template="""You are an AI language model assistant. Your task is to generate five
+# Prompts compiled once at import: every question then reuses the same
+# objects, and the byte-identical static prefix lets Ollama's prompt
+# cache prefill the preamble tokens once per session
+QUERY_PROMPT = PromptTemplate(
+    input_variables=["question"],
+    template="""You are an AI language model assistant. Your task is to generate five
 different versions of the given user question to retrieve relevant documents from
 a vector database. By generating multiple perspectives on the user question, your
 goal is to help the user overcome some of the limitations of the distance-based
 similarity search. Provide these alternative questions separated by newlines.
 Original question: {question}""",
-    )
+)
 
+RAG_TEMPLATE = """Answer the question based ONLY on the following context:
+{context} providing a detailed, considered response with citations from the context.
+The audience is an expert accessibility auditor with may years of experience in software development, feel free to use appropriate terminology and ontologies.
+If the question cannot be answered using the information provided, answer with "I don't know".
+Question: {question}
+"""
+
+RAG_PROMPT = ChatPromptTemplate.from_template(RAG_TEMPLATE)
+
+
+def create_retriever(vector_db):
+    """Create a direct similarity retriever — the default hot path."""
+    retriever = vector_db.as_retriever(search_kwargs={"k": 8})
+    logging.info("Retriever created.")
+    return retriever
+
+
+def create_multiquery_retriever(vector_db, llm):
+    """Create the multi-query retriever used for hard queries.
+
+    Generating five paraphrases costs five extra LLM calls per question,
+    so this only runs when direct similarity search scores poorly.
+    """
     retriever = MultiQueryRetriever.from_llm(
         vector_db.as_retriever(), llm, prompt=QUERY_PROMPT
     )
-    logging.info("Retriever created.")
+    logging.info("Multi-query retriever created.")
     return retriever
 
 
 def create_chain(retriever, llm):
     """Create the chain with preserved syntax."""
-    # RAG prompt
-    template = """Answer the question based ONLY on the following context:
-{context} providing a detailed, considered response with citations from the context.
-The audience is an expert accessibility auditor with may years of experience in software development, feel free to use appropriate terminology and ontologies.
-If the question cannot be answered using the information provided, answer with "I don't know".
-Question: {question}
-"""
-
-    prompt = ChatPromptTemplate.from_template(template)
-
     chain = (
         {"context": retriever, "question": RunnablePassthrough()}
-        | prompt
+        | RAG_PROMPT
         | llm
         | StrOutputParser()
     )
@@ -316,26 +577,51 @@ def main():
         if user_input:
             with st.spinner("Generating response..."):
                 try:
-                    # Initialize the language model
-                    llm = ChatOllama(model=MODEL_NAME, temperature=0.3, max_tokens=65536)
-
-                    # Load the vector database
-                    vector_db = load_vector_db()
-                    if vector_db is None:
-                        st.error("Failed to load or create the vector database.")
-                        return
-
-                    # Create the retriever
-                    retriever = create_retriever(vector_db, llm)
-
-                    # Create the chain
-                    chain = create_chain(retriever, llm)
-
-                    # Get the response
-                    response = chain.invoke(input=user_input)
-
-                    st.markdown("**Assistant:**")
-                    st.write(response)
+                    # Check the semantic cache first: near-duplicate
+                    # questions are answered without touching the chain
+                    cache = get_semantic_cache()
+                    embedding_model = OllamaEmbeddings(model=EMBEDDING_MODEL)
+                    query_embedding = embedding_model.embed_query(user_input)
+                    response = cache.lookup(query_embedding)
+
+                    if response is not None:
+                        st.markdown("**Assistant:**")
+                        st.write(response)
+                    else:
+                        # Initialize the language model
+                        llm = ChatOllama(model=MODEL_NAME, temperature=0.3,
+                                         num_predict=MAX_TOKENS)
+
+                        # Load the vector database
+                        vector_db = load_vector_db()
+                        if vector_db is None:
+                            st.error("Failed to load or create the vector database.")
+                            return
+
+                        # Create the retriever: direct vector search by
+                        # default, MultiQuery only when the best match
+                        # scores poorly
+                        retriever = create_retriever(vector_db)
+                        scored = vector_db.similarity_search_with_relevance_scores(
+                            user_input, k=1
+                        )
+                        if not scored or scored[0][1] < MULTIQUERY_FALLBACK_THRESHOLD:
+                            retriever = create_multiquery_retriever(vector_db, llm)
+
+                        # Create the chain
+                        chain = create_chain(retriever, llm)
+
+                        # Stream the response so the user sees tokens at
+                        # time-to-first-token instead of waiting for the
+                        # full generation
+                        st.markdown("**Assistant:**")
+                        placeholder = st.empty()
+                        parts = []
+                        for token in chain.stream(user_input):
+                            parts.append(token)
+                            placeholder.markdown("".join(parts))
+                        response = "".join(parts)
+                        cache.add(query_embedding, user_input, response)
                 except Exception as e:
                     st.error(f"An error occurred: {str(e)}")
         else:
@@ -458,79 +744,83 @@ def main():
             st.subheader("Add New Document")
             
             # File upload section
-            uploaded_file = st.file_uploader("Choose a PDF file", type="pdf")
-            document_title = st.text_input("Document Title (optional)", "")
+            uploaded_files = st.file_uploader("Choose PDF files", type="pdf",
+                                              accept_multiple_files=True)
+            document_title = st.text_input("Document Title (optional, single file only)", "")
             document_authors = st.text_input("Authors (optional)", placeholder="e.g., Smith, J., Doe, A.")
-            acm_reference = st.text_area("ACM Bibliographic Reference (optional)", 
+            acm_reference = st.text_area("ACM Bibliographic Reference (optional)",
                                        placeholder="e.g., Smith, J. and Doe, A. 2023. Title of Paper. In Proceedings...")
-            
-            if uploaded_file is not None:
-                if st.button("➕ Add Document"):
-                    # Save uploaded file temporarily
-                    temp_path = f"./temp_{uploaded_file.name}"
-                    with open(temp_path, "wb") as f:
-                        f.write(uploaded_file.getbuffer())
-                    
+
+            if uploaded_files:
+                if st.button("➕ Add Documents"):
+                    # Save the uploads temporarily and build one ingest
+                    # job per file that is not already in the collection
+                    temp_paths = []
+                    jobs = []
                     try:
-                        # Check if already added
-                        if is_document_already_added(temp_path):
-                            st.warning("This document has already been added.")
-                        else:
-                            # Process the document
-                            title = document_title if document_title else uploaded_file.name
-                            data = ingest_pdf(temp_path, title, document_authors, acm_reference)
-                            
-                            if data:
-                                # Add to vector database
-                                vector_db = get_vector_db_instance()
-                                add_documents_to_vector_store(vector_db, data)
-                                
-                                # Clear cache to refresh the vector db
-                                st.cache_resource.clear()
-                                
-                                st.success(f"Document '{title}' added successfully!")
+                        for uploaded_file in uploaded_files:
+                            temp_path = f"./temp_{uploaded_file.name}"
+                            with open(temp_path, "wb") as f:
+                                f.write(uploaded_file.getbuffer())
+                            temp_paths.append(temp_path)
+
+                            if is_document_already_added(temp_path):
+                                st.warning(f"'{uploaded_file.name}' has already been added.")
+                                continue
+
+                            if document_title and len(uploaded_files) == 1:
+                                title = document_title
+                            else:
+                                title = uploaded_file.name
+                            jobs.append((temp_path, title, document_authors, acm_reference))
+
+                        if jobs:
+                            # Ingest across cores, then add everything in
+                            # one batch so embedding batches stay large
+                            documents = ingest_pdfs_parallel(jobs)
+
+                            if documents:
+                                # Append to the live handle; no cache
+                                # clear or re-open needed afterwards
+                                vector_db = load_vector_db()
+                                add_documents_to_vector_store(vector_db, documents)
+
+                                st.success(f"Added {len(documents)} document(s) successfully!")
                                 st.rerun()
                             else:
-                                st.error("Failed to process the document.")
+                                st.error("Failed to process the documents.")
                     except Exception as e:
-                        st.error(f"Error adding document: {str(e)}")
+                        st.error(f"Error adding documents: {str(e)}")
                     finally:
-                        # Clean up temp file
-                        if os.path.exists(temp_path):
-                            os.remove(temp_path)
+                        # Clean up temp files
+                        for temp_path in temp_paths:
+                            if os.path.exists(temp_path):
+                                os.remove(temp_path)
         
         with mgmt_tab3:
             st.subheader("Document Analytics")
-            
-            # Author distribution
-            if stats["authors"]:
-                st.write("**Author Distribution:**")
-                metadata = load_documents_metadata()
-                author_counts = {}
-                for info in metadata.values():
-                    if info.get('authors'):
-                        doc_authors = [author.strip() for author in info['authors'].split(',')]
-                        for author in doc_authors:
-                            author_counts[author] = author_counts.get(author, 0) + 1
-                
-                # Sort by count
-                sorted_authors = sorted(author_counts.items(), key=lambda x: x[1], reverse=True)
-                for author, count in sorted_authors[:20]:  # Show top 20
-                    st.write(f"- {author}: {count} document(s)")
-            
-            # Timeline
-            st.write("**Documents Added Over Time:**")
+
+            # One pass over the (cached) metadata feeds both charts
             metadata = load_documents_metadata()
-            date_counts = {}
+            author_counts = Counter()
+            date_counts = Counter()
             for info in metadata.values():
+                if info.get('authors'):
+                    author_counts.update(
+                        author.strip() for author in info['authors'].split(','))
                 date = info.get('added_at', '')[:10]
                 if date:
-                    date_counts[date] = date_counts.get(date, 0) + 1
-            
+                    date_counts[date] += 1
+
+            # Author distribution
+            if author_counts:
+                st.write("**Author Distribution:**")
+                st.bar_chart(dict(author_counts.most_common(20)))
+
+            # Timeline
+            st.write("**Documents Added Over Time:**")
             if date_counts:
-                sorted_dates = sorted(date_counts.items())
-                for date, count in sorted_dates:
-                    st.write(f"- {date}: {count} document(s)")
+                st.bar_chart(dict(sorted(date_counts.items())))
             else:
                 st.info("No date information available.")
 
@@ -2,6 +2,7 @@
 Application constants and configuration values.
 """
 
+import re
 from enum import Enum
 from typing import Dict, List
 
@@ -54,6 +55,15 @@ ACCESSIBILITY_DOMAINS = {
     ]
 }
 
+# Frozen views of the accessibility domains for C-speed membership tests
+# and cached sizes, so per-query scoring never re-derives either
+ACCESSIBILITY_DOMAINS_SETS = {
+    domain: frozenset(terms) for domain, terms in ACCESSIBILITY_DOMAINS.items()
+}
+ACCESSIBILITY_DOMAIN_SIZES = {
+    domain: len(terms) for domain, terms in ACCESSIBILITY_DOMAINS.items()
+}
+
 # Technology Domains
 TECHNOLOGY_DOMAINS = {
     "html": [
@@ -74,6 +84,13 @@ TECHNOLOGY_DOMAINS = {
     ]
 }
 
+TECHNOLOGY_DOMAINS_SETS = {
+    domain: frozenset(terms) for domain, terms in TECHNOLOGY_DOMAINS.items()
+}
+TECHNOLOGY_DOMAIN_SIZES = {
+    domain: len(terms) for domain, terms in TECHNOLOGY_DOMAINS.items()
+}
+
 # Standards Hierarchy
 STANDARDS_HIERARCHY = {
     "wcag": {
@@ -130,6 +147,27 @@ DOCUMENT_TYPE_PATTERNS = {
     }
 }
 
+# Same patterns compiled once at import time so classification never pays
+# re.compile per document. Filename patterns are real regexes; metadata and
+# content patterns are plain keywords, escaped before compilation.
+COMPILED_DOCUMENT_TYPE_PATTERNS = {
+    doc_type: {
+        "filename_patterns": [
+            re.compile(pattern, re.IGNORECASE)
+            for pattern in spec["filename_patterns"]
+        ],
+        "metadata_patterns": [
+            re.compile(re.escape(pattern), re.IGNORECASE)
+            for pattern in spec["metadata_patterns"]
+        ],
+        "content_patterns": [
+            re.compile(re.escape(pattern), re.IGNORECASE)
+            for pattern in spec["content_patterns"]
+        ],
+    }
+    for doc_type, spec in DOCUMENT_TYPE_PATTERNS.items()
+}
+
 # Chunk processing constants
 CHUNK_SIZE = 850
 CHUNK_OVERLAP = 300
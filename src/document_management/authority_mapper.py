@@ -3,12 +3,43 @@ Authority mapping system for identifying and scoring author expertise in accessi
 """
 
 import re
+import sys
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
+from collections import defaultdict
+from itertools import chain
 from config.constants import EXPERT_AUTHORS, AuthorityLevel
 
+# Precompiled patterns shared by all AuthorityMapper instances
+_AFFIL_PATTERNS = [
+    re.compile(r'^(.+?)\s*\((.+?)\)$'),  # Name (Affiliation)
+    re.compile(r'^(.+?)\s*,\s*(.+?)$'),   # Name, Affiliation
+    re.compile(r'^(.+?)\s*-\s*(.+?)$'),   # Name - Affiliation
+]
+_TITLE_RE = re.compile(r'\b(Dr|Prof|Professor|Mr|Ms|Mrs)\.?\s*', re.IGNORECASE)
+_SUFFIX_RE = re.compile(r'\s*(Jr|Sr|PhD|Ph\.D\.|MD|M\.D\.)\.?\s*$', re.IGNORECASE)
+_SPLIT_RE = re.compile(r'[,;]|\sand\s|\&')
 
-@dataclass
+# Single alternation over all affiliation authority keywords; the matched
+# named group identifies the category.  Resolution order mirrors the
+# original cascade: standards bodies beat tech companies beat academia
+# beats consulting.
+_AFFIL_AUTHORITY_RE = re.compile(
+    r'(?P<norm>w3c|world wide web consortium|iso)'
+    r'|(?P<tech>google|microsoft|apple|mozilla|adobe|facebook|meta)'
+    r'|(?P<acad>university|college|institute|research)'
+    r'|(?P<prof>accessibility|usability|inclusive|deque|tpg)'
+)
+_AFFIL_GROUP_AUTHORITY = {
+    'norm': AuthorityLevel.NORMATIVE,
+    'tech': AuthorityLevel.PROFESSIONAL,
+    'acad': AuthorityLevel.PEER_REVIEWED,
+    'prof': AuthorityLevel.PROFESSIONAL,
+}
+_AFFIL_GROUP_PRIORITY = ('norm', 'tech', 'acad', 'prof')
+
+
+@dataclass(slots=True)
 class AuthorProfile:
     """Profile information for an author."""
     name: str
@@ -26,6 +57,25 @@ class AuthorityMapper:
     def __init__(self):
         self.expert_database = self._build_expert_database()
         self.affiliation_patterns = self._build_affiliation_patterns()
+
+        # Lookup indexes so expert matching avoids scanning the whole database
+        self._expert_by_lower: Dict[str, str] = {}
+        self._expert_order: Dict[str, int] = {}
+        self._experts_by_token: Dict[str, List[str]] = defaultdict(list)
+        for expert_name in self.expert_database:
+            self._index_expert(expert_name)
+
+        # Memoized profiles keyed by the raw authors string; collections
+        # repeat the same byline across many documents
+        self._profile_cache: Dict[str, List[AuthorProfile]] = {}
+
+    def _index_expert(self, name: str) -> None:
+        """Register an expert name in the lookup indexes."""
+        name_lower = name.lower()
+        self._expert_by_lower[name_lower] = name
+        self._expert_order.setdefault(name, len(self._expert_order))
+        for token in name_lower.split():
+            self._experts_by_token[token].append(name)
     
     def analyze_authors(self, authors_string: str) -> List[AuthorProfile]:
         """
@@ -39,17 +89,22 @@ class AuthorityMapper:
         """
         if not authors_string:
             return []
-        
+
+        cached = self._profile_cache.get(authors_string)
+        if cached is not None:
+            return cached
+
         # Parse individual authors
         parsed_authors = self._parse_authors(authors_string)
-        
+
         # Analyze each author
         profiles = []
         for author_info in parsed_authors:
             profile = self._analyze_single_author(author_info)
             if profile:
                 profiles.append(profile)
-        
+
+        self._profile_cache[authors_string] = profiles
         return profiles
     
     def get_document_authority_score(self, authors_string: str) -> Tuple[AuthorityLevel, float]:
@@ -81,7 +136,7 @@ class AuthorityMapper:
         authors = []
         
         # Split by common delimiters
-        author_parts = re.split(r'[,;]|\sand\s|\&', authors_string)
+        author_parts = _SPLIT_RE.split(authors_string)
         
         for part in author_parts:
             part = part.strip()
@@ -101,15 +156,8 @@ class AuthorityMapper:
     
     def _extract_name_and_affiliation(self, author_part: str) -> Tuple[str, str]:
         """Extract name and affiliation from author string part."""
-        # Common patterns for affiliations
-        affiliation_patterns = [
-            r'^(.+?)\s*\((.+?)\)$',  # Name (Affiliation)
-            r'^(.+?)\s*,\s*(.+?)$',   # Name, Affiliation
-            r'^(.+?)\s*-\s*(.+?)$',   # Name - Affiliation
-        ]
-        
-        for pattern in affiliation_patterns:
-            match = re.match(pattern, author_part.strip())
+        for pattern in _AFFIL_PATTERNS:
+            match = pattern.match(author_part.strip())
             if match:
                 name = match.group(1).strip()
                 affiliation = match.group(2).strip()
@@ -121,13 +169,12 @@ class AuthorityMapper:
     def _clean_name(self, name: str) -> str:
         """Clean and normalize author name."""
         # Remove titles and suffixes
-        cleaned = re.sub(r'\b(Dr|Prof|Professor|Mr|Ms|Mrs)\.?\s*', '', name, flags=re.IGNORECASE)
-        cleaned = re.sub(r'\s*(Jr|Sr|PhD|Ph\.D\.|MD|M\.D\.)\.?\s*$', '', cleaned, flags=re.IGNORECASE)
+        cleaned = _TITLE_RE.sub('', name)
+        cleaned = _SUFFIX_RE.sub('', cleaned)
         
-        # Remove extra whitespace
-        cleaned = ' '.join(cleaned.split())
-        
-        return cleaned
+        # Remove extra whitespace; intern so the many repeats of the same
+        # author name across a collection share one string object
+        return sys.intern(' '.join(cleaned.split()))
     
     def _analyze_single_author(self, author_info: Dict[str, str]) -> Optional[AuthorProfile]:
         """Analyze a single author for authority and expertise."""
@@ -171,26 +218,36 @@ class AuthorityMapper:
     def _find_expert_match(self, name: str) -> Optional[str]:
         """Find matching expert name with fuzzy matching."""
         name_lower = name.lower()
-        
+
         # Exact match
-        for expert_name in self.expert_database:
-            if expert_name.lower() == name_lower:
-                return expert_name
-        
-        # Fuzzy matching - check for partial matches
-        for expert_name in self.expert_database:
-            expert_lower = expert_name.lower()
-            
-            # Check if all parts of the input name appear in expert name
-            name_parts = name_lower.split()
-            expert_parts = expert_lower.split()
-            
+        exact = self._expert_by_lower.get(name_lower)
+        if exact:
+            return exact
+
+        # Fuzzy matching - check for partial matches among experts sharing
+        # at least one name token (a shared token is a precondition for any
+        # first/last-name match)
+        name_parts = name_lower.split()
+        if len(name_parts) < 2:
+            return None
+
+        candidates = set()
+        for token in name_parts:
+            candidates.update(self._experts_by_token.get(token, ()))
+        if not candidates:
+            return None
+
+        # Walk candidates in database insertion order so ties resolve the
+        # same way the old full scan did
+        for expert_name in sorted(candidates, key=self._expert_order.__getitem__):
+            expert_parts = expert_name.lower().split()
+
             # Match if most significant parts match (first name + last name)
-            if len(name_parts) >= 2 and len(expert_parts) >= 2:
+            if len(expert_parts) >= 2:
                 if (name_parts[0] in expert_parts and name_parts[-1] in expert_parts) or \
                    (expert_parts[0] in name_parts and expert_parts[-1] in name_parts):
                     return expert_name
-        
+
         return None
     
     def _analyze_affiliation(self, affiliation: str) -> Optional[AuthorityLevel]:
@@ -198,32 +255,17 @@ class AuthorityMapper:
         if not affiliation:
             return None
         
-        affiliation_lower = affiliation.lower()
-        
-        # W3C and standards organizations
-        if any(org in affiliation_lower for org in ['w3c', 'world wide web consortium', 'iso']):
-            return AuthorityLevel.NORMATIVE
-        
-        # Major tech companies with accessibility teams
-        tech_companies = ['google', 'microsoft', 'apple', 'mozilla', 'adobe', 'facebook', 'meta']
-        if any(company in affiliation_lower for company in tech_companies):
-            return AuthorityLevel.PROFESSIONAL
-        
-        # Academic institutions
-        academic_indicators = ['university', 'college', 'institute', 'research']
-        if any(indicator in affiliation_lower for indicator in academic_indicators):
-            return AuthorityLevel.PEER_REVIEWED
-        
-        # Accessibility consulting companies
-        consulting_indicators = ['accessibility', 'usability', 'inclusive', 'deque', 'tpg']
-        if any(indicator in affiliation_lower for indicator in consulting_indicators):
-            return AuthorityLevel.PROFESSIONAL
-        
+        seen = {match.lastgroup for match in
+                _AFFIL_AUTHORITY_RE.finditer(affiliation.lower())}
+        for group in _AFFIL_GROUP_PRIORITY:
+            if group in seen:
+                return _AFFIL_GROUP_AUTHORITY[group]
+
         return None
     
     def _build_expert_database(self) -> Dict[str, Dict]:
         """Build database of known experts from constants."""
-        return {name: data for name, data in EXPERT_AUTHORS.items()}
+        return {sys.intern(name): data for name, data in EXPERT_AUTHORS.items()}
     
     def _build_affiliation_patterns(self) -> Dict[str, AuthorityLevel]:
         """Build patterns for organization-based authority mapping."""
@@ -245,13 +287,12 @@ class AuthorityMapper:
             'authority': authority,
             'expertise': expertise
         }
+        self._index_expert(name)
+        self._profile_cache.clear()
     
     def get_expertise_areas(self, authors_string: str) -> List[str]:
         """Get all expertise areas covered by the authors."""
-        profiles = self.analyze_authors(authors_string)
-        expertise_areas = []
-        
-        for profile in profiles:
-            expertise_areas.extend(profile.expertise_areas)
-        
-        return list(set(expertise_areas))  # Remove duplicates
\ No newline at end of file
+        return list(dict.fromkeys(chain.from_iterable(
+            profile.expertise_areas
+            for profile in self.analyze_authors(authors_string)
+        )))  # Remove duplicates, keeping first-seen order
\ No newline at end of file
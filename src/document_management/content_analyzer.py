@@ -3,18 +3,144 @@ Content analyzer for examining existing document collections and extracting patt
 """
 
 import json
+import os
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Tuple, Set
 from collections import Counter, defaultdict
 from dataclasses import dataclass
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from config.constants import DocumentType, EXPERT_AUTHORS
-from .document_classifier import DocumentClassifier
-from .authority_mapper import AuthorityMapper
 
+# Term extraction constants, built once at import time
+_WORD_RE = re.compile(r'\b[a-zA-Z]{3,}\b')
+# One alternation over all known expert names (case-sensitive, matching the
+# original substring checks)
+_EXPERT_NAMES = tuple(EXPERT_AUTHORS)
+_EXPERT_AUTHORS_RE = re.compile('|'.join(re.escape(name) for name in _EXPERT_NAMES))
+# First characters of all expert names; an authors string containing none of
+# them cannot contain any expert name, so the regex can be skipped
+_EXPERT_INITIALS = frozenset(name[0] for name in _EXPERT_NAMES)
+_EXPERT_SURNAMES = tuple(dict.fromkeys(name.split()[-1] for name in _EXPERT_NAMES))
+
+
+def _has_expert_author(authors: str) -> bool:
+    """Check whether an authors string mentions a known expert.
+
+    The initial-set and surname-substring gates are necessary conditions
+    for the alternation to match, so they only ever skip work on the
+    common no-expert path.
+    """
+    return bool(
+        _EXPERT_INITIALS.intersection(authors)
+        and any(surname in authors for surname in _EXPERT_SURNAMES)
+        and _EXPERT_AUTHORS_RE.search(authors)
+    )
+
+
+def _analyze_chunk(doc_infos: List[Dict]) -> Tuple[Counter, Counter, Counter, Counter, Counter]:
+    """
+    Accumulate partial analysis counters for one slice of the metadata.
 
-@dataclass
+    Module-level and self-free so it can be shipped to worker processes;
+    partial counters from different slices merge with Counter.update.
+
+    Returns:
+        Tuple of (document type counts, byline counts, author counts,
+        missing field counts, term counts)
+    """
+    type_counts = Counter()
+    authors_counts = Counter()
+    author_counts = Counter()
+    missing_counts = Counter()
+    text_parts = []
+
+    for doc_info in doc_infos:
+        title = doc_info.get('title', '')
+        authors = doc_info.get('authors', '')
+        acm_ref = doc_info.get('acm_reference', '')
+
+        # Simple heuristic classification; one scan of the reference and
+        # (when needed) one scan of the title replace the chain of
+        # substring checks, with the original branch priority kept
+        ref_groups = {m.lastgroup for m in _DOC_TYPE_REF_RE.finditer(acm_ref)}
+        if 'std' in ref_groups:
+            doc_type = 'standards_document'
+        elif _has_expert_author(authors):
+            doc_type = 'expert_blog'
+        elif 'acad' in ref_groups:
+            doc_type = 'academic_paper'
+        else:
+            title_groups = {m.lastgroup for m in _DOC_TYPE_TITLE_RE.finditer(title.lower())}
+            if 'audit' in title_groups:
+                doc_type = 'audit_ticket'
+            elif 'test' in title_groups and 'transcript' in title_groups:
+                doc_type = 'testing_transcript'
+            else:
+                doc_type = 'unknown'
+        type_counts[doc_type] += 1
+
+        # Authority is scored per distinct byline by the caller
+        authors_counts[authors] += 1
+
+        # Simple author parsing; intern the names so repeated authors
+        # share one string object as Counter keys
+        if authors:
+            author_counts.update(
+                sys.intern(author) for author in
+                map(str.strip, _AUTHOR_SPLIT_RE.split(authors))
+                if author
+            )
+
+        missing_counts.update(
+            field for field in _EXPECTED_FIELDS if not doc_info.get(field)
+        )
+
+        text_parts.append(f"{title} {acm_ref}")
+
+    # Join the slice's corpus and run one findall over it; a single scan
+    # in C beats one regex call per document
+    corpus = '\n'.join(text_parts).lower()
+    # Simple term extraction (could be improved with NLP)
+    term_counts = Counter(
+        term for term in _WORD_RE.findall(corpus)
+        if term not in _STOP_WORDS and len(term) > 3
+    )
+
+    return type_counts, authors_counts, author_counts, missing_counts, term_counts
+# Document-type keywords, grouped by the heuristic branch they trigger.
+# Reference keywords are deliberately case-sensitive (WCAG/W3C/ACM are
+# treated as markers only in their canonical capitalisation); title
+# keywords match against the lowercased title as before.
+_DOC_TYPE_REF_RE = re.compile(r'(?P<std>WCAG|W3C)|(?P<acad>ACM|Proceedings)')
+_DOC_TYPE_TITLE_RE = re.compile(r'(?P<audit>audit|violation)|(?P<test>test)|(?P<transcript>transcript)')
+_AUTHOR_SPLIT_RE = re.compile(r'[,;&]|\sand\s')
+_EXPECTED_FIELDS = ('title', 'authors', 'acm_reference', 'added_at', 'chunks_count')
+
+# Collections below this size are analyzed in-process; above it the work is
+# fanned out across CPU cores
+_PARALLEL_THRESHOLD = 5000
+_STOP_WORDS = frozenset({
+    'the', 'and', 'for', 'are', 'but', 'not', 'you', 'all', 'can', 'had',
+    'her', 'was', 'one', 'our', 'out', 'day', 'get', 'has', 'him', 'his',
+    'how', 'its', 'may', 'new', 'now', 'old', 'see', 'two', 'who', 'boy',
+    'did', 'what', 'where', 'when', 'will', 'with', 'have', 'this', 'that',
+    'from', 'they', 'she', 'been', 'than', 'said', 'each', 'which', 'their',
+    'time', 'way', 'about', 'many', 'then', 'them', 'these', 'so', 'some',
+    'would', 'make', 'like', 'into', 'more', 'go',
+    'no', 'do', 'does', 'were', 'my', 'very', 'an', 'is', 'it', 'be', 'to',
+    'of', 'in', 'a'
+})
+
+
+@dataclass(slots=True)
 class ContentAnalysisResult:
     """Result of content analysis."""
     total_documents: int
@@ -32,8 +158,24 @@ class ContentAnalyzer:
     """
     
     def __init__(self):
-        self.classifier = DocumentClassifier()
-        self.authority_mapper = AuthorityMapper()
+        # Both helpers are built on first use; analyses that never touch
+        # them skip the construction cost entirely.
+        self._classifier = None
+        self._authority_mapper = None
+
+    @property
+    def classifier(self):
+        if self._classifier is None:
+            from .document_classifier import DocumentClassifier
+            self._classifier = DocumentClassifier()
+        return self._classifier
+
+    @property
+    def authority_mapper(self):
+        if self._authority_mapper is None:
+            from .authority_mapper import AuthorityMapper
+            self._authority_mapper = AuthorityMapper()
+        return self._authority_mapper
     
     def analyze_document_collection(self, metadata_file_path: str) -> ContentAnalysisResult:
         """
@@ -45,10 +187,11 @@ class ContentAnalyzer:
         Returns:
             ContentAnalysisResult with analysis findings
         """
-        # Load existing metadata
+        # Load existing metadata in one read; orjson's C parser is several
+        # times faster than the stdlib on large metadata files
         try:
-            with open(metadata_file_path, 'r', encoding='utf-8') as f:
-                metadata = json.load(f)
+            raw = Path(metadata_file_path).read_bytes()
+            metadata = orjson.loads(raw) if orjson else json.loads(raw)
         except FileNotFoundError:
             print(f"Metadata file not found: {metadata_file_path}")
             return self._empty_analysis_result()
@@ -62,22 +205,11 @@ class ContentAnalyzer:
         
         # Analyze documents
         print(f"Analyzing {len(metadata)} documents...")
-        
-        # Document type distribution (estimate from current metadata)
-        doc_type_dist = self._analyze_document_types(metadata)
-        
-        # Authority distribution (estimate from authors)
-        authority_dist = self._analyze_authority_distribution(metadata)
-        
-        # Common terms analysis
-        common_terms = self._extract_common_terms(metadata)
-        
-        # Author analysis
-        author_analysis = self._analyze_authors(metadata)
-        
-        # Missing metadata analysis
-        missing_fields = self._find_missing_metadata(metadata)
-        
+
+        # All per-document analyses run in a single pass over the metadata
+        (doc_type_dist, authority_dist, common_terms,
+         author_analysis, missing_fields) = self._analyze_metadata(metadata)
+
         # Generate recommendations
         recommendations = self._generate_recommendations(
             len(metadata), doc_type_dist, authority_dist, missing_fields
@@ -147,118 +279,64 @@ class ContentAnalyzer:
         
         return suggestions
     
-    def _analyze_document_types(self, metadata: Dict) -> Dict[str, int]:
-        """Analyze document type distribution."""
-        type_counts = defaultdict(int)
-        
-        for doc_path, doc_info in metadata.items():
-            # Try to classify based on existing metadata
-            title = doc_info.get('title', '')
-            authors = doc_info.get('authors', '')
-            acm_ref = doc_info.get('acm_reference', '')
-            
-            # Simple heuristic classification
-            if 'WCAG' in acm_ref or 'W3C' in acm_ref:
-                doc_type = 'standards_document'
-            elif any(expert in authors for expert in EXPERT_AUTHORS.keys()):
-                doc_type = 'expert_blog'
-            elif 'ACM' in acm_ref or 'Proceedings' in acm_ref:
-                doc_type = 'academic_paper'
-            elif 'audit' in title.lower() or 'violation' in title.lower():
-                doc_type = 'audit_ticket'
-            elif 'test' in title.lower() and 'transcript' in title.lower():
-                doc_type = 'testing_transcript'
-            else:
-                doc_type = 'unknown'
-            
-            type_counts[doc_type] += 1
-        
-        return dict(type_counts)
-    
-    def _analyze_authority_distribution(self, metadata: Dict) -> Dict[str, int]:
-        """Analyze authority level distribution."""
-        authority_counts = defaultdict(int)
-        
-        for doc_path, doc_info in metadata.items():
-            authors = doc_info.get('authors', '')
-            
-            # Get authority level
+    def _analyze_metadata(
+        self, metadata: Dict
+    ) -> Tuple[Dict[str, int], Dict[str, int], List[Tuple[str, int]], Dict[str, int], List[str]]:
+        """
+        Run all per-document analyses in a single pass over the metadata.
+
+        Returns:
+            Tuple of (document type distribution, authority distribution,
+            common terms, author frequencies, missing metadata fields)
+        """
+        doc_infos = list(metadata.values())
+
+        if len(doc_infos) > _PARALLEL_THRESHOLD:
+            # Fan the slices out across cores; regex-heavy counting is
+            # CPU-bound, and the partial Counters merge associatively
+            workers = os.cpu_count() or 1
+            slice_size = -(-len(doc_infos) // workers)
+            slices = [doc_infos[i:i + slice_size]
+                      for i in range(0, len(doc_infos), slice_size)]
+
+            type_counts = Counter()
+            authors_counts = Counter()
+            author_counts = Counter()
+            missing_counts = Counter()
+            term_counts = Counter()
+            totals = (type_counts, authors_counts, author_counts,
+                      missing_counts, term_counts)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for partials in executor.map(_analyze_chunk, slices):
+                    for total, partial in zip(totals, partials):
+                        total.update(partial)
+        else:
+            (type_counts, authors_counts, author_counts,
+             missing_counts, term_counts) = _analyze_chunk(doc_infos)
+
+        # Score each distinct authors string once and weight by how many
+        # documents share it; collections reuse the same byline heavily
+        authority_counts = Counter()
+        for authors, doc_count in authors_counts.items():
             authority_level, confidence = self.authority_mapper.get_document_authority_score(authors)
-            authority_counts[authority_level.value] += 1
-        
-        return dict(authority_counts)
-    
-    def _extract_common_terms(self, metadata: Dict) -> List[Tuple[str, int]]:
-        """Extract common terms from titles and references."""
-        all_text = []
-        
-        for doc_info in metadata.values():
-            title = doc_info.get('title', '')
-            acm_ref = doc_info.get('acm_reference', '')
-            all_text.append(f"{title} {acm_ref}")
-        
-        # Extract terms
-        terms = []
-        for text in all_text:
-            # Simple term extraction (could be improved with NLP)
-            words = re.findall(r'\b[a-zA-Z]{3,}\b', text.lower())
-            terms.extend(words)
-        
-        # Filter out common stop words
-        stop_words = {
-            'the', 'and', 'for', 'are', 'but', 'not', 'you', 'all', 'can', 'had', 
-            'her', 'was', 'one', 'our', 'out', 'day', 'get', 'has', 'him', 'his', 
-            'how', 'its', 'may', 'new', 'now', 'old', 'see', 'two', 'who', 'boy', 
-            'did', 'what', 'where', 'when', 'will', 'with', 'have', 'this', 'that',
-            'from', 'they', 'she', 'been', 'than', 'said', 'each', 'which', 'their',
-            'time', 'way', 'about', 'many', 'then', 'them', 'these', 'so', 'some',
-            'her', 'would', 'make', 'like', 'into', 'him', 'has', 'more', 'go',
-            'no', 'do', 'does', 'were', 'my', 'very', 'an', 'is', 'it', 'be', 'to',
-            'of', 'in', 'a'
-        }
-        
-        filtered_terms = [term for term in terms if term not in stop_words and len(term) > 3]
-        
-        # Count and return top terms
-        term_counts = Counter(filtered_terms)
-        return term_counts.most_common(100)
-    
-    def _analyze_authors(self, metadata: Dict) -> Dict[str, int]:
-        """Analyze author frequency."""
-        author_counts = defaultdict(int)
-        
-        for doc_info in metadata.values():
-            authors_str = doc_info.get('authors', '')
-            if authors_str:
-                # Simple author parsing
-                authors = re.split(r'[,;&]|\sand\s', authors_str)
-                for author in authors:
-                    author = author.strip()
-                    if author:
-                        author_counts[author] += 1
-        
-        return dict(author_counts)
-    
-    def _find_missing_metadata(self, metadata: Dict) -> List[str]:
-        """Find commonly missing metadata fields."""
-        missing_counts = defaultdict(int)
+            authority_counts[authority_level.value] += doc_count
+
+        # Report fields missing from >10% of documents
         total_docs = len(metadata)
-        
-        expected_fields = ['title', 'authors', 'acm_reference', 'added_at', 'chunks_count']
-        
-        for doc_info in metadata.values():
-            for field in expected_fields:
-                if not doc_info.get(field):
-                    missing_counts[field] += 1
-        
-        # Return fields missing from >10% of documents
         missing_fields = []
         for field, count in missing_counts.items():
             percentage = (count / total_docs) * 100
             if percentage > 10:
                 missing_fields.append(f"{field} ({percentage:.1f}% missing)")
-        
-        return missing_fields
+
+        return (
+            dict(type_counts),
+            dict(authority_counts),
+            # No consumer looks past the top 50 terms, so rank only that many
+            term_counts.most_common(50),
+            dict(author_counts),
+            missing_fields,
+        )
     
     def _generate_recommendations(
         self, 
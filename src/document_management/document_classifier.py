@@ -4,17 +4,143 @@ Document type classification system for identifying and categorizing different t
 
 import re
 import os
+import hashlib
+from itertools import islice
 from typing import Tuple, Dict, List, Optional
 from dataclasses import dataclass
 from pathlib import Path
 
 from config.constants import (
-    DocumentType, 
-    AuthorityLevel, 
-    DOCUMENT_TYPE_PATTERNS, 
+    DocumentType,
+    AuthorityLevel,
+    COMPILED_DOCUMENT_TYPE_PATTERNS,
     EXPERT_AUTHORS
 )
 
+# Classification rule tables, compiled once at import. Each entry is
+# (compiled pattern, document type key, weight added when it matches).
+_FILENAME_RULES = (
+    (re.compile(r'\d{4}\.\d{4}\.\d{4}'), 'academic_paper', 0.8),  # ACM DOI pattern
+    (re.compile(r'(ieee|acm|chi|assets|w4a)'), 'academic_paper', 0.6),
+    (re.compile(r'(wcag|section.?508|en.?301)'), 'standards_document', 0.9),
+    (re.compile(r'(w3c|iso|standard|spec)'), 'standards_document', 0.5),
+    (re.compile(r'(blog|post|article)'), 'expert_blog', 0.6),
+    (re.compile(r'(audit|ticket|issue|violation)'), 'audit_ticket', 0.7),
+    (re.compile(r'(test|transcript|recording|session)'), 'testing_transcript', 0.6),
+)
+
+# Content rules carry guard literals: every possible match of the pattern
+# contains at least one guard, so a C-speed substring check can skip the
+# regex engine entirely when the guard is absent. Each rule also names the
+# zone it scans: abstract/keywords front matter lives in the document head
+# and reference lists in the tail, so on long documents those rules only
+# scan a bounded window instead of the whole text; everything else is 'any'
+_SCAN_WINDOW = 32768
+_CONTENT_RULES = (
+    # Academic paper patterns
+    (('abstract',), re.compile(r'\babstract\b.*?\bkeywords\b'), 'academic_paper', 0.15, 'head'),
+    (('methodology',), re.compile(r'\bmethodology\b.*?\bresults\b'), 'academic_paper', 0.15, 'any'),
+    (('experiment',), re.compile(r'\bexperiment\b.*?\bconclusion\b'), 'academic_paper', 0.15, 'any'),
+    (('citation',), re.compile(r'\breferences\b.*?\bcitation\b'), 'academic_paper', 0.15, 'tail'),
+    (('<',), re.compile(r'\bp\s*<\s*0\.\d+'), 'academic_paper', 0.15, 'any'),  # statistical significance
+    (('=',), re.compile(r'\bn\s*=\s*\d+'), 'academic_paper', 0.15, 'any'),     # sample size
+    # Standards document patterns
+    (('conformance', 'compliance'), re.compile(r'\b(must|shall|should|may)\b.*\b(conformance|compliance)\b'), 'standards_document', 0.2, 'any'),
+    (('success criteri',), re.compile(r'\bsuccess criteri[ao]n?\b'), 'standards_document', 0.2, 'any'),
+    (('level',), re.compile(r'\blevel\s+(a|aa|aaa)\b'), 'standards_document', 0.2, 'any'),
+    (('normative',), re.compile(r'\bnormative\b.*\binformative\b'), 'standards_document', 0.2, 'any'),
+    (('standard', 'specification', 'recommendation'), re.compile(r'\bthis\s+(standard|specification|recommendation)\b'), 'standards_document', 0.2, 'any'),
+    # Blog/expert content patterns
+    (('in this',), re.compile(r'\bin this (post|article)\b'), 'expert_blog', 0.2, 'any'),
+    (('recommend', 'suggest', 'think'), re.compile(r'\bi (recommend|suggest|think)\b'), 'expert_blog', 0.2, 'any'),
+    (('best practice',), re.compile(r'\bbest practice\b'), 'expert_blog', 0.2, 'any'),
+    (('trick',), re.compile(r'\btip\b.*\btrick\b'), 'expert_blog', 0.2, 'any'),
+    (('how to',), re.compile(r'\bhow to\b.*\bstep\b'), 'expert_blog', 0.2, 'any'),
+    # Audit ticket patterns
+    (('found', 'detected', 'identified'), re.compile(r'\b(violation|issue|error|warning)\b.*\b(found|detected|identified)\b'), 'audit_ticket', 0.2, 'any'),
+    (('remediation',), re.compile(r'\bremediation\b.*\bsteps?\b'), 'audit_ticket', 0.2, 'any'),
+    (('priority',), re.compile(r'\bpriority\b.*\b(high|medium|low|critical)\b'), 'audit_ticket', 0.2, 'any'),
+    (('wcag',), re.compile(r'\bwcag\s+\d+\.\d+\.\d+\b'), 'audit_ticket', 0.2, 'any'),
+    (('assistive technology',), re.compile(r'\bassistive technology\b.*\b(fails?|problem)\b'), 'audit_ticket', 0.2, 'any'),
+    # Testing transcript patterns
+    (('said', 'reported', 'mentioned'), re.compile(r'\b(user|tester)\b.*\b(said|reported|mentioned)\b'), 'testing_transcript', 0.2, 'any'),
+    (('screen reader',), re.compile(r'\bscreen reader\b.*\b(announced|read|spoke)\b'), 'testing_transcript', 0.2, 'any'),
+    (('navigation',), re.compile(r'\bnavigation\b.*\b(successful|failed|difficult)\b'), 'testing_transcript', 0.2, 'any'),
+    (('task',), re.compile(r'\btask\b.*\b(completed|failed|abandoned)\b'), 'testing_transcript', 0.2, 'any'),
+    (('timestamp', ':'), re.compile(r'\btimestamp\b|\b\d{2}:\d{2}\b'), 'testing_transcript', 0.2, 'any'),
+)
+
+# All distinct guard literals as one longest-first alternation, so a single
+# scan of the content discovers every rule worth running. A guard contained
+# in a longer guard can be shadowed by it in a non-overlapping scan, so the
+# implication table marks longer guards as proving their substrings present.
+_ALL_GUARDS = sorted(
+    {guard for guards, _, _, _, _ in _CONTENT_RULES for guard in guards},
+    key=len, reverse=True,
+)
+_GUARD_RE = re.compile('|'.join(re.escape(guard) for guard in _ALL_GUARDS))
+_GUARD_IMPLIES = {
+    guard: tuple(other for other in _ALL_GUARDS if other != guard and other in guard)
+    for guard in _ALL_GUARDS
+}
+
+# Metadata keyword indicators: every literal goes into one alternation
+# (longest first so nested literals cannot shadow each other) and maps back
+# to its (type, weight) bucket, so one scan replaces a check per keyword
+_METADATA_INDICATOR_WEIGHTS = {
+    'academic_paper': (0.2, ('doi:', 'abstract:', 'keywords:', 'acm', 'ieee', 'conference', 'proceedings')),
+    'standards_document': (0.3, ('w3c', 'iso', 'standard', 'specification', 'recommendation')),
+    'expert_blog': (0.3, ('blog', 'post', 'article', 'medium', 'dev.to')),
+}
+_META_KW_BUCKET = {
+    keyword: (doc_type, weight)
+    for doc_type, (weight, keywords) in _METADATA_INDICATOR_WEIGHTS.items()
+    for keyword in keywords
+}
+_META_KW_RE = re.compile('|'.join(
+    re.escape(keyword)
+    for keyword in sorted(_META_KW_BUCKET, key=len, reverse=True)
+))
+
+# Expert names, lowercased, as one alternation for author analysis
+_EXPERT_ITEMS = tuple((name.lower(), info) for name, info in EXPERT_AUTHORS.items())
+_EXPERT_BY_LC = dict(_EXPERT_ITEMS)
+_EXPERT_RANK = {name_lc: rank for rank, (name_lc, _) in enumerate(_EXPERT_ITEMS)}
+_EXPERT_NAME_LC_RE = re.compile('|'.join(
+    re.escape(name_lc)
+    for name_lc in sorted((name_lc for name_lc, _ in _EXPERT_ITEMS), key=len, reverse=True)
+))
+_ACADEMIC_AFFIL_RE = re.compile('university|college|institute|research|lab')
+
+# Signal scores key document types by their string value; resolve them to
+# the enum through a table instead of a try/except per classification
+_STR_TO_DOCTYPE = {doc_type.value: doc_type for doc_type in DocumentType}
+
+# Classification is deterministic in its inputs, so reingest workflows can
+# reuse earlier results; bounded to keep memory flat on huge corpora
+_CLASSIFY_CACHE_MAX = 4096
+
+# Signal weights used when aggregating per-signal scores into a type score
+_SIGNAL_WEIGHTS = {
+    'filename': 0.2,
+    'metadata': 0.3,
+    'content': 0.4,
+    'author': 0.25,
+    'structure': 0.15
+}
+_DEFAULT_SIGNAL_WEIGHT = 0.1
+
+# Structural element patterns, counted by _analyze_document_structure
+_SECTION_HDR_RE = re.compile(r'\n\s*\d+\.?\s+[A-Z]')
+_BULLET_RE = re.compile(r'\n\s*[•\-\*]\s+')
+_NUMBERED_RE = re.compile(r'\n\s*\d+\.\s+')
+_CITATION_RE = re.compile(r'\[\d+\]|\(\d{4}\)')
+
+
+def _count_up_to(pattern: 're.Pattern', text: str, limit: int) -> int:
+    """Count matches lazily, stopping the scan once limit is reached."""
+    return sum(1 for _ in islice(pattern.finditer(text), limit))
+
 
 @dataclass
 class ClassificationResult:
@@ -33,6 +159,7 @@ class DocumentClassifier:
     
     def __init__(self):
         self.classification_rules = self._build_classification_rules()
+        self._result_cache: Dict[tuple, ClassificationResult] = {}
     
     def classify_document(
         self, 
@@ -54,188 +181,148 @@ class DocumentClassifier:
             ClassificationResult with type, confidence, and reasoning
         """
         filename = os.path.basename(filepath).lower()
+
+        # Classification is deterministic, so repeat ingests of the same
+        # document resolve from the cache without rescanning the content
+        cache_key = (
+            filename,
+            hashlib.blake2b(content.encode(), digest_size=16).digest(),
+            tuple(sorted((str(k), str(v)) for k, v in metadata.items())),
+            authors,
+        )
+        cached = self._result_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         content_lower = content.lower()
-        metadata_text = " ".join(str(v) for v in metadata.values()).lower()
-        
+        authors_lower = authors.lower()
+
         # Collect classification signals
         signals = {
             "filename": self._analyze_filename(filename),
-            "metadata": self._analyze_metadata(metadata_text),
+            "metadata": self._analyze_metadata(metadata),
             "content": self._analyze_content(content_lower),
-            "author": self._analyze_authors(authors),
+            "author": self._analyze_authors(authors_lower),
             "structure": self._analyze_document_structure(content)
         }
-        
+
         # Determine document type
         doc_type, confidence = self._determine_document_type(signals)
-        
+
         # Determine authority level
-        authority_level = self._determine_authority_level(doc_type, authors, metadata, content)
+        authority_level = self._determine_authority_level(doc_type, authors_lower, metadata, content)
         
         # Build reasoning
         reasoning = self._build_reasoning(signals, doc_type, authority_level)
         
-        return ClassificationResult(
+        result = ClassificationResult(
             document_type=doc_type,
             confidence=confidence,
             authority_level=authority_level,
             detected_features=signals,
             reasoning=reasoning
         )
+
+        if len(self._result_cache) >= _CLASSIFY_CACHE_MAX:
+            # Drop the oldest entry; dicts iterate in insertion order
+            self._result_cache.pop(next(iter(self._result_cache)))
+        self._result_cache[cache_key] = result
+        return result
     
     def _analyze_filename(self, filename: str) -> Dict[str, float]:
         """Analyze filename for document type indicators."""
         scores = {}
-        
-        # Academic paper indicators
-        if re.search(r'\d{4}\.\d{4}\.\d{4}', filename):  # ACM DOI pattern
-            scores['academic_paper'] = 0.8
-        if re.search(r'(ieee|acm|chi|assets|w4a)', filename):
-            scores['academic_paper'] = scores.get('academic_paper', 0) + 0.6
-        
-        # Standards document indicators
-        if re.search(r'(wcag|section.?508|en.?301)', filename):
-            scores['standards_document'] = 0.9
-        if re.search(r'(w3c|iso|standard|spec)', filename):
-            scores['standards_document'] = scores.get('standards_document', 0) + 0.5
-        
-        # Blog/article indicators
-        if re.search(r'(blog|post|article)', filename):
-            scores['expert_blog'] = 0.6
-        
-        # Audit/ticket indicators
-        if re.search(r'(audit|ticket|issue|violation)', filename):
-            scores['audit_ticket'] = 0.7
-        
-        # Testing transcript indicators
-        if re.search(r'(test|transcript|recording|session)', filename):
-            scores['testing_transcript'] = 0.6
-        
+
+        for pattern, doc_type, weight in _FILENAME_RULES:
+            if pattern.search(filename):
+                scores[doc_type] = scores.get(doc_type, 0) + weight
+
         return scores
     
-    def _analyze_metadata(self, metadata_text: str) -> Dict[str, float]:
+    def _analyze_metadata(self, metadata: Dict) -> Dict[str, float]:
         """Analyze metadata for document type indicators."""
         scores = {}
-        
-        # Academic paper indicators
-        academic_indicators = ['doi:', 'abstract:', 'keywords:', 'acm', 'ieee', 'conference', 'proceedings']
-        academic_score = sum(0.2 for indicator in academic_indicators if indicator in metadata_text)
-        if academic_score > 0:
-            scores['academic_paper'] = min(academic_score, 1.0)
-        
-        # Standards indicators
-        standards_indicators = ['w3c', 'iso', 'standard', 'specification', 'recommendation']
-        standards_score = sum(0.3 for indicator in standards_indicators if indicator in metadata_text)
-        if standards_score > 0:
-            scores['standards_document'] = min(standards_score, 1.0)
-        
-        # Blog indicators
-        blog_indicators = ['blog', 'post', 'article', 'medium', 'dev.to']
-        blog_score = sum(0.3 for indicator in blog_indicators if indicator in metadata_text)
-        if blog_score > 0:
-            scores['expert_blog'] = min(blog_score, 1.0)
-        
-        return scores
+
+        # Scan each value as it comes instead of materializing one big
+        # joined-and-lowercased string; no keyword contains a space, so
+        # nothing could ever match across a value boundary. Each distinct
+        # keyword still scores once, as the membership checks did
+        found = set()
+        for value in metadata.values():
+            found.update(m.group(0) for m in _META_KW_RE.finditer(str(value).lower()))
+
+        for keyword in found:
+            doc_type, weight = _META_KW_BUCKET[keyword]
+            scores[doc_type] = scores.get(doc_type, 0) + weight
+
+        return {doc_type: min(score, 1.0) for doc_type, score in scores.items()}
     
     def _analyze_content(self, content: str) -> Dict[str, float]:
         """Analyze content for document type indicators."""
         scores = {}
-        
-        # Academic paper patterns
-        academic_patterns = [
-            r'\babstract\b.*?\bkeywords\b',
-            r'\bmethodology\b.*?\bresults\b',
-            r'\bexperiment\b.*?\bconclusion\b',
-            r'\breferences\b.*?\bcitation\b',
-            r'\bp\s*<\s*0\.\d+',  # statistical significance
-            r'\bn\s*=\s*\d+',     # sample size
-        ]
-        academic_score = sum(0.15 for pattern in academic_patterns if re.search(pattern, content))
-        if academic_score > 0:
-            scores['academic_paper'] = min(academic_score, 1.0)
-        
-        # Standards document patterns
-        standards_patterns = [
-            r'\b(must|shall|should|may)\b.*\b(conformance|compliance)\b',
-            r'\bsuccess criteri[ao]n?\b',
-            r'\blevel\s+(a|aa|aaa)\b',
-            r'\bnormative\b.*\binformative\b',
-            r'\bthis\s+(standard|specification|recommendation)\b'
-        ]
-        standards_score = sum(0.2 for pattern in standards_patterns if re.search(pattern, content))
-        if standards_score > 0:
-            scores['standards_document'] = min(standards_score, 1.0)
-        
-        # Blog/expert content patterns
-        blog_patterns = [
-            r'\bin this (post|article)\b',
-            r'\bi (recommend|suggest|think)\b',
-            r'\bbest practice\b',
-            r'\btip\b.*\btrick\b',
-            r'\bhow to\b.*\bstep\b'
-        ]
-        blog_score = sum(0.2 for pattern in blog_patterns if re.search(pattern, content))
-        if blog_score > 0:
-            scores['expert_blog'] = min(blog_score, 1.0)
-        
-        # Audit ticket patterns
-        audit_patterns = [
-            r'\b(violation|issue|error|warning)\b.*\b(found|detected|identified)\b',
-            r'\bremediation\b.*\bsteps?\b',
-            r'\bpriority\b.*\b(high|medium|low|critical)\b',
-            r'\bwcag\s+\d+\.\d+\.\d+\b',
-            r'\bassistive technology\b.*\b(fails?|problem)\b'
-        ]
-        audit_score = sum(0.2 for pattern in audit_patterns if re.search(pattern, content))
-        if audit_score > 0:
-            scores['audit_ticket'] = min(audit_score, 1.0)
-        
-        # Testing transcript patterns
-        testing_patterns = [
-            r'\b(user|tester)\b.*\b(said|reported|mentioned)\b',
-            r'\bscreen reader\b.*\b(announced|read|spoke)\b',
-            r'\bnavigation\b.*\b(successful|failed|difficult)\b',
-            r'\btask\b.*\b(completed|failed|abandoned)\b',
-            r'\btimestamp\b|\b\d{2}:\d{2}\b'
-        ]
-        testing_score = sum(0.2 for pattern in testing_patterns if re.search(pattern, content))
-        if testing_score > 0:
-            scores['testing_transcript'] = min(testing_score, 1.0)
-        
-        return scores
+
+        # One pass finds every guard literal in the content; each rule then
+        # consults the set instead of rescanning the document per guard
+        present = {m.group(0) for m in _GUARD_RE.finditer(content)}
+        for guard in tuple(present):
+            present.update(_GUARD_IMPLIES[guard])
+
+        # Head- and tail-zone rules only look at a bounded window on long
+        # documents; short documents scan everything either way
+        if len(content) > 2 * _SCAN_WINDOW:
+            views = {
+                'head': content[:_SCAN_WINDOW],
+                'tail': content[-_SCAN_WINDOW:],
+                'any': content,
+            }
+        else:
+            views = None
+
+        for guards, pattern, doc_type, weight, zone in _CONTENT_RULES:
+            text = content if views is None else views[zone]
+            if not present.isdisjoint(guards) and pattern.search(text):
+                scores[doc_type] = scores.get(doc_type, 0) + weight
+
+        # Cap each type's score at 1.0, as the per-bucket sums did before
+        return {doc_type: min(score, 1.0) for doc_type, score in scores.items()}
     
-    def _analyze_authors(self, authors: str) -> Dict[str, float]:
-        """Analyze authors for expertise indicators."""
+    def _analyze_authors(self, authors_lower: str) -> Dict[str, float]:
+        """Analyze authors (already lowercased) for expertise indicators."""
         scores = {}
-        
-        if not authors:
+
+        if not authors_lower:
             return scores
-        
-        # Check against known expert authors
-        for expert_name, expert_info in EXPERT_AUTHORS.items():
-            if expert_name.lower() in authors.lower():
-                # High authority authors typically write expert blogs or standards
-                if expert_info["authority"] >= 4:
-                    scores['expert_blog'] = 0.8
-                    scores['standards_document'] = 0.6
-                break
-        
+
+        # Check against known expert authors: one scan finds every mentioned
+        # name, then the first match in database order decides, as before
+        found = {m.group(0) for m in _EXPERT_NAME_LC_RE.finditer(authors_lower)}
+        if found:
+            for name_lc, expert_info in _EXPERT_ITEMS:
+                if name_lc in found:
+                    # High authority authors typically write expert blogs or standards
+                    if expert_info["authority"] >= 4:
+                        scores['expert_blog'] = 0.8
+                        scores['standards_document'] = 0.6
+                    break
+
         # Academic institution indicators
-        academic_indicators = ['university', 'college', 'institute', 'research', 'lab']
-        if any(indicator in authors.lower() for indicator in academic_indicators):
+        if _ACADEMIC_AFFIL_RE.search(authors_lower):
             scores['academic_paper'] = 0.5
-        
+
         return scores
     
     def _analyze_document_structure(self, content: str) -> Dict[str, float]:
         """Analyze document structure for type indicators."""
         scores = {}
         
-        # Count specific structural elements
-        section_headers = len(re.findall(r'\n\s*\d+\.?\s+[A-Z]', content))
-        bullet_points = len(re.findall(r'\n\s*[•\-\*]\s+', content))
-        numbered_lists = len(re.findall(r'\n\s*\d+\.\s+', content))
-        citations = len(re.findall(r'\[\d+\]|\(\d{4}\)', content))
+        # Count specific structural elements. The counts are only ever
+        # compared against fixed thresholds below, so each scan can stop
+        # one past its highest threshold instead of walking the whole
+        # document and materialising every match
+        section_headers = _count_up_to(_SECTION_HDR_RE, content, 6)
+        bullet_points = _count_up_to(_BULLET_RE, content, 6)
+        numbered_lists = _count_up_to(_NUMBERED_RE, content, 11)
+        citations = _count_up_to(_CITATION_RE, content, 11)
         
         # Academic papers typically have many citations and numbered sections
         if citations > 10 and section_headers > 3:
@@ -253,67 +340,69 @@ class DocumentClassifier:
     
     def _determine_document_type(self, signals: Dict) -> Tuple[DocumentType, float]:
         """Determine document type from all signals."""
-        # Aggregate scores for each document type
+        # Aggregate scores for each document type; weights resolve once per
+        # signal rather than once per (signal, type) pair
         type_scores = {}
-        
+
         for signal_type, signal_scores in signals.items():
+            weight = _SIGNAL_WEIGHTS.get(signal_type, _DEFAULT_SIGNAL_WEIGHT)
             for doc_type, score in signal_scores.items():
-                if doc_type in type_scores:
-                    type_scores[doc_type] += score * self._get_signal_weight(signal_type)
-                else:
-                    type_scores[doc_type] = score * self._get_signal_weight(signal_type)
+                type_scores[doc_type] = type_scores.get(doc_type, 0.0) + score * weight
         
         if not type_scores:
             return DocumentType.UNKNOWN, 0.0
         
-        # Find the highest scoring type
-        best_type = max(type_scores.items(), key=lambda x: x[1])
-        doc_type_str = best_type[0]
-        confidence = min(best_type[1], 1.0)
-        
-        # Convert string to DocumentType enum
-        try:
-            doc_type = DocumentType(doc_type_str)
-        except ValueError:
-            # Handle legacy string values
-            type_mapping = {
-                'academic_paper': DocumentType.ACADEMIC_PAPER,
-                'standards_document': DocumentType.STANDARDS_DOCUMENT,
-                'expert_blog': DocumentType.EXPERT_BLOG,
-                'audit_ticket': DocumentType.AUDIT_TICKET,
-                'testing_transcript': DocumentType.TESTING_TRANSCRIPT
-            }
-            doc_type = type_mapping.get(doc_type_str, DocumentType.UNKNOWN)
-        
+        # Find the highest scoring type; inline argmax avoids a lambda
+        # call per candidate on this hot path
+        doc_type_str = None
+        best_score = -1.0
+        for candidate, score in type_scores.items():
+            if score > best_score:
+                doc_type_str = candidate
+                best_score = score
+        confidence = min(best_score, 1.0)
+        
+        # Convert string to DocumentType enum; the old per-call fallback
+        # dict only repeated enum values, so the table subsumes it
+        doc_type = _STR_TO_DOCTYPE.get(doc_type_str, DocumentType.UNKNOWN)
+
         return doc_type, confidence
     
     def _get_signal_weight(self, signal_type: str) -> float:
         """Get weight for different signal types."""
-        weights = {
-            'filename': 0.2,
-            'metadata': 0.3,
-            'content': 0.4,
-            'author': 0.25,
-            'structure': 0.15
-        }
-        return weights.get(signal_type, 0.1)
+        return _SIGNAL_WEIGHTS.get(signal_type, _DEFAULT_SIGNAL_WEIGHT)
     
     def _determine_authority_level(
-        self, 
-        doc_type: DocumentType, 
-        authors: str, 
-        metadata: Dict, 
+        self,
+        doc_type: DocumentType,
+        authors_lower: str,
+        metadata: Dict,
         content: str
     ) -> AuthorityLevel:
         """Determine authority level based on document type and authorship."""
-        
-        # Check for known expert authors
-        for expert_name, expert_info in EXPERT_AUTHORS.items():
-            if expert_name.lower() in authors.lower():
+
+        # Fast path for canonical bylines: when every comma-separated token
+        # is itself a known expert name, dict lookups replace the substring
+        # scans. Matches still resolve in database order, and authority-3
+        # researchers fall through to the defaults exactly as the scan did
+        tokens = [token.strip() for token in authors_lower.split(',')]
+        matched = [token for token in tokens if token in _EXPERT_BY_LC]
+        if len(matched) == len(tokens):
+            for name_lc in sorted(matched, key=_EXPERT_RANK.__getitem__):
+                expert_info = _EXPERT_BY_LC[name_lc]
                 if expert_info["authority"] == 5:
                     return AuthorityLevel.NORMATIVE if doc_type == DocumentType.STANDARDS_DOCUMENT else AuthorityLevel.EXPERT_INTERPRETIVE
                 elif expert_info["authority"] == 4:
                     return AuthorityLevel.EXPERT_INTERPRETIVE
+        else:
+            # Non-canonical byline: fall back to the substring scan over
+            # pre-lowercased names
+            for name_lc, expert_info in _EXPERT_ITEMS:
+                if name_lc in authors_lower:
+                    if expert_info["authority"] == 5:
+                        return AuthorityLevel.NORMATIVE if doc_type == DocumentType.STANDARDS_DOCUMENT else AuthorityLevel.EXPERT_INTERPRETIVE
+                    elif expert_info["authority"] == 4:
+                        return AuthorityLevel.EXPERT_INTERPRETIVE
         
         # Default authority levels by document type
         authority_defaults = {
@@ -339,9 +428,14 @@ class DocumentClassifier:
         
         for signal_type, signal_scores in signals.items():
             if signal_scores:
-                top_signal = max(signal_scores.items(), key=lambda x: x[1])
-                if top_signal[1] > 0.3:
-                    reasons.append(f"{signal_type}: {top_signal[0]} (score: {top_signal[1]:.2f})")
+                top_type = None
+                top_score = -1.0
+                for candidate, score in signal_scores.items():
+                    if score > top_score:
+                        top_type = candidate
+                        top_score = score
+                if top_score > 0.3:
+                    reasons.append(f"{signal_type}: {top_type} (score: {top_score:.2f})")
         
         reasoning = f"Classified as {doc_type.value} (authority: {authority_level.value}) based on: " + "; ".join(reasons)
         return reasoning
@@ -349,4 +443,4 @@ class DocumentClassifier:
     def _build_classification_rules(self) -> Dict:
         """Build classification rules from patterns."""
         # This would be expanded with more sophisticated rule building
-        return DOCUMENT_TYPE_PATTERNS
\ No newline at end of file
+        return COMPILED_DOCUMENT_TYPE_PATTERNS
\ No newline at end of file
@@ -2,13 +2,49 @@
 Enhanced metadata schema for document management with ontology-enhanced features.
 """
 
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+import json
+import os
+from typing import Dict, List, Optional, Any, Set, Tuple
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime
-from enum import Enum
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from config.constants import DocumentType, AuthorityLevel
 
+# Value-to-member maps so deserialization avoids enum construction (which
+# walks the member list) for every author of every document on load
+_DT_BY_VALUE = {member.value: member for member in DocumentType}
+_AUTH_BY_VALUE = {member.value: member for member in AuthorityLevel}
+
+# Stores small enough that pool startup would dominate load sequentially
+_PARALLEL_LOAD_THRESHOLD = 256
+
+
+def _is_legacy_format(doc_data: Dict[str, Any]) -> bool:
+    """Check if metadata is in legacy format."""
+    legacy_fields = {'title', 'authors', 'acm_reference', 'chunks_count', 'added_at'}
+    enhanced_fields = {'document_id', 'classification', 'ontology_mapping', 'processing_info'}
+
+    has_legacy = any(field in doc_data for field in legacy_fields)
+    has_enhanced = any(field in doc_data for field in enhanced_fields)
+
+    return has_legacy and not has_enhanced
+
+
+def _deserialize_one(item: 'Tuple[str, Dict[str, Any]]') -> 'Tuple[str, DocumentMetadata]':
+    """Deserialize one (doc_id, raw dict) pair; mapped over by load_metadata."""
+    doc_id, doc_data = item
+    if _is_legacy_format(doc_data):
+        return doc_id, DocumentMetadata.from_legacy_metadata(doc_data, doc_id, doc_id)
+    return doc_id, DocumentMetadata.from_dict(doc_data)
+
 
 @dataclass
 class AuthorInfo:
@@ -19,6 +55,16 @@ class AuthorInfo:
     affiliation: Optional[str] = None
     confidence_score: float = 0.0
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dict for JSON serialization."""
+        return {
+            'name': self.name,
+            'authority_level': self.authority_level.value,
+            'expertise_areas': list(self.expertise_areas),
+            'affiliation': self.affiliation,
+            'confidence_score': self.confidence_score,
+        }
+
 
 @dataclass
 class ClassificationInfo:
@@ -29,6 +75,16 @@ class ClassificationInfo:
     classification_method: str
     reasoning: str
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dict for JSON serialization."""
+        return {
+            'document_type': self.document_type.value,
+            'confidence': self.confidence,
+            'detected_features': dict(self.detected_features),
+            'classification_method': self.classification_method,
+            'reasoning': self.reasoning,
+        }
+
 
 @dataclass
 class OntologyMapping:
@@ -39,6 +95,16 @@ class OntologyMapping:
     accessibility_focus: List[str]
     standards_referenced: List[str]
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dict for JSON serialization."""
+        return {
+            'mentioned_concepts': list(self.mentioned_concepts),
+            'primary_domains': list(self.primary_domains),
+            'technology_stack': list(self.technology_stack),
+            'accessibility_focus': list(self.accessibility_focus),
+            'standards_referenced': list(self.standards_referenced),
+        }
+
 
 @dataclass
 class ProcessingInfo:
@@ -50,6 +116,17 @@ class ProcessingInfo:
     vector_collection: str
     last_updated: datetime
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dict for JSON serialization."""
+        return {
+            'ingestion_date': self.ingestion_date.isoformat(),
+            'processing_version': self.processing_version,
+            'chunk_count': self.chunk_count,
+            'embedding_model': self.embedding_model,
+            'vector_collection': self.vector_collection,
+            'last_updated': self.last_updated.isoformat(),
+        }
+
 
 @dataclass
 class QualityMetrics:
@@ -59,6 +136,15 @@ class QualityMetrics:
     classification_confidence: float  # 0-1, confidence in document type
     ontology_coverage: float  # 0-1, how well document maps to ontology
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dict for JSON serialization."""
+        return {
+            'completeness_score': self.completeness_score,
+            'authority_confidence': self.authority_confidence,
+            'classification_confidence': self.classification_confidence,
+            'ontology_coverage': self.ontology_coverage,
+        }
+
 
 @dataclass
 class DocumentMetadata:
@@ -97,19 +183,26 @@ class DocumentMetadata:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        def convert_value(value):
-            if isinstance(value, datetime):
-                return value.isoformat()
-            elif isinstance(value, Enum):
-                return value.value
-            elif isinstance(value, list):
-                return [convert_value(item) for item in value]
-            elif hasattr(value, '__dict__'):
-                return {k: convert_value(v) for k, v in asdict(value).items()}
-            else:
-                return value
-        
-        return {k: convert_value(v) for k, v in asdict(self).items()}
+        return {
+            'document_id': self.document_id,
+            'title': self.title,
+            'source_path': self.source_path,
+            'file_type': self.file_type,
+            'file_size': self.file_size,
+            'authors': [author.to_dict() for author in self.authors],
+            'publication_date': self.publication_date.isoformat() if self.publication_date else None,
+            'acm_reference': self.acm_reference,
+            'doi': self.doi,
+            'abstract': self.abstract,
+            'keywords': list(self.keywords) if self.keywords else self.keywords,
+            'classification': self.classification.to_dict() if self.classification else None,
+            'overall_authority': self.overall_authority.value,
+            'ontology_mapping': self.ontology_mapping.to_dict() if self.ontology_mapping else None,
+            'processing_info': self.processing_info.to_dict() if self.processing_info else None,
+            'quality_metrics': self.quality_metrics.to_dict() if self.quality_metrics else None,
+            'chunks_count': self.chunks_count,
+            'added_at': self.added_at,
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'DocumentMetadata':
@@ -130,18 +223,18 @@ class DocumentMetadata:
         # Handle classification
         if 'classification' in data and data['classification']:
             classification_data = data['classification']
-            classification_data['document_type'] = DocumentType(classification_data['document_type'])
+            classification_data['document_type'] = _DT_BY_VALUE[classification_data['document_type']]
             data['classification'] = ClassificationInfo(**classification_data)
         
         # Handle authority level
         if 'overall_authority' in data:
-            data['overall_authority'] = AuthorityLevel(data['overall_authority'])
+            data['overall_authority'] = _AUTH_BY_VALUE[data['overall_authority']]
         
         # Handle authors
         if 'authors' in data and data['authors']:
             authors = []
             for author_data in data['authors']:
-                author_data['authority_level'] = AuthorityLevel(author_data['authority_level'])
+                author_data['authority_level'] = _AUTH_BY_VALUE[author_data['authority_level']]
                 authors.append(AuthorInfo(**author_data))
             data['authors'] = authors
         
@@ -204,39 +297,127 @@ class MetadataManager:
     
     def __init__(self, metadata_file_path: str):
         self.metadata_file_path = metadata_file_path
+        # Append-only sidecar log; single-document mutations append one
+        # line here instead of rewriting the whole .json snapshot
+        self.log_file_path = os.path.splitext(metadata_file_path)[0] + '.jsonl'
         self._metadata_cache = {}
-    
+        self._loaded = False
+        self._mtime = 0.0
+        self._batch_depth = 0
+        self._dirty = False
+        self._rebuild_indexes()
+
+    @contextmanager
+    def batch(self):
+        """Suppress per-mutation disk writes; flush once when the batch ends.
+
+        Bulk ingests wrap their loop in `with manager.batch():` so each
+        add/update/delete only touches the in-memory cache and indexes,
+        and a single snapshot is written on exit.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._dirty:
+                self.save_metadata(self._metadata_cache)
+                self._dirty = False
+
+    def _ensure_loaded(self) -> None:
+        """Load from disk once, or again if the snapshot changed behind us."""
+        try:
+            mtime = os.path.getmtime(self.metadata_file_path)
+        except OSError:
+            mtime = 0.0
+
+        if self._loaded and mtime <= self._mtime:
+            return
+
+        self.load_metadata()
+
+    def _rebuild_indexes(self) -> None:
+        """Rebuild the secondary indexes from the current cache."""
+        self._by_doc_type: Dict[DocumentType, Set[str]] = defaultdict(set)
+        self._by_authority: Dict[AuthorityLevel, Set[str]] = defaultdict(set)
+        self._by_file_type: Dict[str, Set[str]] = defaultdict(set)
+        self._by_author_lower: Dict[str, Set[str]] = defaultdict(set)
+        self._total_chunks = 0
+        for doc_id, doc_metadata in self._metadata_cache.items():
+            self._index_document(doc_id, doc_metadata)
+
+    def _index_document(self, doc_id: str, doc_metadata: DocumentMetadata) -> None:
+        """Add a document to the secondary indexes."""
+        if doc_metadata.classification:
+            self._by_doc_type[doc_metadata.classification.document_type].add(doc_id)
+        self._by_authority[doc_metadata.overall_authority].add(doc_id)
+        self._by_file_type[doc_metadata.file_type].add(doc_id)
+        for author in doc_metadata.authors:
+            self._by_author_lower[author.name.lower()].add(doc_id)
+        if doc_metadata.processing_info:
+            self._total_chunks += doc_metadata.processing_info.chunk_count
+
+    def _unindex_document(self, doc_id: str, doc_metadata: DocumentMetadata) -> None:
+        """Remove a document from the secondary indexes."""
+        if doc_metadata.classification:
+            self._by_doc_type[doc_metadata.classification.document_type].discard(doc_id)
+        self._by_authority[doc_metadata.overall_authority].discard(doc_id)
+        self._by_file_type[doc_metadata.file_type].discard(doc_id)
+        for author in doc_metadata.authors:
+            self._by_author_lower[author.name.lower()].discard(doc_id)
+        if doc_metadata.processing_info:
+            self._total_chunks -= doc_metadata.processing_info.chunk_count
+
     def load_metadata(self) -> Dict[str, DocumentMetadata]:
-        """Load all metadata from file."""
+        """Load all metadata from the snapshot, then replay the log."""
+        metadata = {}
         try:
-            import json
             with open(self.metadata_file_path, 'r', encoding='utf-8') as f:
                 raw_data = json.load(f)
-            
-            metadata = {}
-            for doc_id, doc_data in raw_data.items():
-                if self._is_legacy_format(doc_data):
-                    metadata[doc_id] = DocumentMetadata.from_legacy_metadata(
-                        doc_data, doc_id, doc_id
-                    )
-                else:
-                    metadata[doc_id] = DocumentMetadata.from_dict(doc_data)
-            
-            self._metadata_cache = metadata
-            return metadata
-            
+
+            # Documents deserialize independently, so large stores fan the
+            # work out across threads; small ones stay sequential
+            if len(raw_data) > _PARALLEL_LOAD_THRESHOLD:
+                with ThreadPoolExecutor() as executor:
+                    metadata = dict(executor.map(_deserialize_one, raw_data.items()))
+            else:
+                metadata = dict(map(_deserialize_one, raw_data.items()))
+
         except FileNotFoundError:
-            return {}
+            pass
         except Exception as e:
             print(f"Error loading metadata: {e}")
             return {}
-    
+
+        # Replay mutations recorded since the last compaction
+        try:
+            with open(self.log_file_path, 'rb') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    entry = orjson.loads(line) if orjson else json.loads(line)
+                    if entry.get('op') == 'del':
+                        metadata.pop(entry['id'], None)
+                    else:
+                        metadata[entry['id']] = DocumentMetadata.from_dict(entry['data'])
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Error replaying metadata log: {e}")
+
+        self._metadata_cache = metadata
+        self._rebuild_indexes()
+        self._loaded = True
+        try:
+            self._mtime = os.path.getmtime(self.metadata_file_path)
+        except OSError:
+            self._mtime = 0.0
+        return metadata
+
     def save_metadata(self, metadata: Dict[str, DocumentMetadata]) -> bool:
-        """Save metadata to file."""
+        """Save a full snapshot to file and reset the log."""
         try:
-            import json
-            import os
-            
             # Ensure directory exists
             os.makedirs(os.path.dirname(self.metadata_file_path), exist_ok=True)
             
@@ -244,119 +425,205 @@ class MetadataManager:
             raw_data = {}
             for doc_id, doc_metadata in metadata.items():
                 raw_data[doc_id] = doc_metadata.to_dict()
-            
-            # Write to file
-            with open(self.metadata_file_path, 'w', encoding='utf-8') as f:
-                json.dump(raw_data, f, indent=2, ensure_ascii=False)
-            
-            self._metadata_cache = metadata
+
+            # Write to file; orjson's C serializer is several times faster
+            # than the stdlib on large metadata files
+            if orjson:
+                with open(self.metadata_file_path, 'wb') as f:
+                    f.write(orjson.dumps(raw_data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(self.metadata_file_path, 'w', encoding='utf-8') as f:
+                    json.dump(raw_data, f, indent=2, ensure_ascii=False)
+
+            # The snapshot now reflects every logged mutation
+            open(self.log_file_path, 'wb').close()
+
+            if metadata is not self._metadata_cache:
+                self._metadata_cache = metadata
+                self._rebuild_indexes()
+            self._loaded = True
+            self._mtime = os.path.getmtime(self.metadata_file_path)
             return True
-            
+
         except Exception as e:
             print(f"Error saving metadata: {e}")
             return False
-    
+
+    def compact(self) -> bool:
+        """Fold the mutation log into a fresh snapshot."""
+        self._ensure_loaded()
+
+        return self.save_metadata(self._metadata_cache)
+
+    def _append_log(self, entry: Dict[str, Any]) -> bool:
+        """Append one mutation record to the sidecar log."""
+        try:
+            os.makedirs(os.path.dirname(self.log_file_path), exist_ok=True)
+
+            if orjson:
+                line = orjson.dumps(entry)
+            else:
+                line = json.dumps(entry, ensure_ascii=False).encode('utf-8')
+            with open(self.log_file_path, 'ab') as f:
+                f.write(line + b'\n')
+
+            return True
+
+        except Exception as e:
+            print(f"Error writing metadata log: {e}")
+            return False
+
+    def _maybe_compact(self) -> None:
+        """Compact once the log outgrows the snapshot it amends."""
+        try:
+            log_size = os.path.getsize(self.log_file_path)
+        except OSError:
+            return
+
+        try:
+            snapshot_size = os.path.getsize(self.metadata_file_path)
+        except OSError:
+            snapshot_size = -1
+
+        if log_size > snapshot_size:
+            self.compact()
+
     def add_document(self, metadata: DocumentMetadata) -> bool:
         """Add or update document metadata."""
-        if not self._metadata_cache:
-            self._metadata_cache = self.load_metadata()
-        
+        self._ensure_loaded()
+
+        existing = self._metadata_cache.get(metadata.document_id)
+        if existing is not None:
+            self._unindex_document(metadata.document_id, existing)
+
         self._metadata_cache[metadata.document_id] = metadata
-        return self.save_metadata(self._metadata_cache)
+        self._index_document(metadata.document_id, metadata)
+        if self._batch_depth:
+            self._dirty = True
+            return True
+
+        if not self._append_log({'op': 'put', 'id': metadata.document_id,
+                                 'data': metadata.to_dict()}):
+            return False
+
+        self._maybe_compact()
+        return True
     
     def get_document(self, document_id: str) -> Optional[DocumentMetadata]:
         """Get metadata for a specific document."""
-        if not self._metadata_cache:
-            self._metadata_cache = self.load_metadata()
+        self._ensure_loaded()
         
         return self._metadata_cache.get(document_id)
     
     def update_document(self, document_id: str, updates: Dict[str, Any]) -> bool:
         """Update specific fields of document metadata."""
-        if not self._metadata_cache:
-            self._metadata_cache = self.load_metadata()
+        self._ensure_loaded()
         
         if document_id not in self._metadata_cache:
             return False
         
         doc_metadata = self._metadata_cache[document_id]
-        
+        self._unindex_document(document_id, doc_metadata)
+
         # Update fields
         for field, value in updates.items():
             if hasattr(doc_metadata, field):
                 setattr(doc_metadata, field, value)
-        
+
         # Update last_updated timestamp
         if doc_metadata.processing_info:
             doc_metadata.processing_info.last_updated = datetime.now()
-        
-        return self.save_metadata(self._metadata_cache)
-    
+
+        self._index_document(document_id, doc_metadata)
+
+        if self._batch_depth:
+            self._dirty = True
+            return True
+
+        if not self._append_log({'op': 'put', 'id': document_id,
+                                 'data': doc_metadata.to_dict()}):
+            return False
+
+        self._maybe_compact()
+        return True
+
     def delete_document(self, document_id: str) -> bool:
         """Delete document metadata."""
-        if not self._metadata_cache:
-            self._metadata_cache = self.load_metadata()
-        
+        self._ensure_loaded()
+
         if document_id in self._metadata_cache:
+            self._unindex_document(document_id, self._metadata_cache[document_id])
             del self._metadata_cache[document_id]
-            return self.save_metadata(self._metadata_cache)
-        
+            if self._batch_depth:
+                self._dirty = True
+                return True
+
+            if not self._append_log({'op': 'del', 'id': document_id}):
+                return False
+
+            self._maybe_compact()
+            return True
+
         return False
     
     def search_documents(self, **criteria) -> List[DocumentMetadata]:
         """Search documents by criteria."""
-        if not self._metadata_cache:
-            self._metadata_cache = self.load_metadata()
-        
+        self._ensure_loaded()
+
+        # Narrow with the secondary indexes before touching any document;
+        # fields without an index (title) are verified on the candidates
+        candidate_ids = None
+        for field, value in criteria.items():
+            if field == 'document_type':
+                ids = self._by_doc_type.get(value, set())
+            elif field == 'authority_level':
+                ids = self._by_authority.get(value, set())
+            elif field == 'author':
+                needle = value.lower()
+                ids = set()
+                for name, name_ids in self._by_author_lower.items():
+                    if needle in name:
+                        ids |= name_ids
+            else:
+                continue
+            candidate_ids = ids if candidate_ids is None else candidate_ids & ids
+            if not candidate_ids:
+                return []
+
         results = []
-        for doc_metadata in self._metadata_cache.values():
+        for doc_id, doc_metadata in self._metadata_cache.items():
+            if candidate_ids is not None and doc_id not in candidate_ids:
+                continue
             if self._matches_criteria(doc_metadata, criteria):
                 results.append(doc_metadata)
-        
+
         return results
-    
+
     def get_statistics(self) -> Dict[str, Any]:
         """Get collection statistics."""
-        if not self._metadata_cache:
-            self._metadata_cache = self.load_metadata()
-        
-        stats = {
+        self._ensure_loaded()
+
+        # All counts fall out of the secondary indexes; no document scan
+        return {
             'total_documents': len(self._metadata_cache),
-            'document_types': {},
-            'authority_levels': {},
-            'file_types': {},
-            'total_chunks': 0
+            'document_types': {
+                doc_type.value: len(ids)
+                for doc_type, ids in self._by_doc_type.items() if ids
+            },
+            'authority_levels': {
+                authority.value: len(ids)
+                for authority, ids in self._by_authority.items() if ids
+            },
+            'file_types': {
+                file_type: len(ids)
+                for file_type, ids in self._by_file_type.items() if ids
+            },
+            'total_chunks': self._total_chunks
         }
-        
-        for doc_metadata in self._metadata_cache.values():
-            # Document types
-            if doc_metadata.classification:
-                doc_type = doc_metadata.classification.document_type.value
-                stats['document_types'][doc_type] = stats['document_types'].get(doc_type, 0) + 1
-            
-            # Authority levels
-            authority = doc_metadata.overall_authority.value
-            stats['authority_levels'][authority] = stats['authority_levels'].get(authority, 0) + 1
-            
-            # File types
-            file_type = doc_metadata.file_type
-            stats['file_types'][file_type] = stats['file_types'].get(file_type, 0) + 1
-            
-            # Total chunks
-            if doc_metadata.processing_info:
-                stats['total_chunks'] += doc_metadata.processing_info.chunk_count
-        
-        return stats
     
     def _is_legacy_format(self, doc_data: Dict[str, Any]) -> bool:
         """Check if metadata is in legacy format."""
-        legacy_fields = {'title', 'authors', 'acm_reference', 'chunks_count', 'added_at'}
-        enhanced_fields = {'document_id', 'classification', 'ontology_mapping', 'processing_info'}
-        
-        has_legacy = any(field in doc_data for field in legacy_fields)
-        has_enhanced = any(field in doc_data for field in enhanced_fields)
-        
-        return has_legacy and not has_enhanced
+        return _is_legacy_format(doc_data)
     
     def _matches_criteria(self, doc_metadata: DocumentMetadata, criteria: Dict[str, Any]) -> bool:
         """Check if document matches search criteria."""
@@ -3,16 +3,82 @@ Ontology manager for loading, querying, and expanding accessibility concepts.
 """
 
 import json
+import mmap
 import os
-from typing import Dict, List, Set, Optional, Tuple
+import pickle
+import re
+import sys
+import unicodedata
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+from typing import Dict, List, NamedTuple, Set, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from dataclasses import dataclass
 
-from config.constants import ACCESSIBILITY_DOMAINS, TECHNOLOGY_DOMAINS
+from config.constants import (
+    ACCESSIBILITY_DOMAINS,
+    ACCESSIBILITY_DOMAIN_SIZES,
+    TECHNOLOGY_DOMAINS,
+    TECHNOLOGY_DOMAIN_SIZES,
+)
+
+# Query results are deterministic per loaded ontology, so repeated queries
+# (reranking, validation loops) resolve from a bounded per-instance cache
+_QUERY_CACHE_MAX = 4096
+
+# Schema files at least this large are parsed straight out of the page
+# cache via mmap instead of read() copying them into a bytes object first
+_MMAP_PARSE_MIN = 1 << 20
+
+
+def _fold(text: str) -> str:
+    """Lowercase and strip accents, so 'Léonie' and 'leonie' match.
+
+    ASCII text short-circuits past the unicode normalisation, which keeps
+    the common case as cheap as a plain lower().
+    """
+    text = text.lower()
+    if text.isascii():
+        return text
+    return ''.join(char for char in unicodedata.normalize('NFKD', text)
+                   if not unicodedata.combining(char))
+
+# Inverted domain-term index: one scan of the query discovers every domain
+# term, then each found term maps straight to its domains, instead of a
+# substring check per term per domain. The lookahead alternation is
+# longest-first with a containment table, like the ontology term scanner,
+# so overlapping and nested terms are all recovered.
+_TERM_TO_DOMAINS: Dict[str, List[str]] = {}
+_DOMAIN_SIZES: Dict[str, int] = dict(ACCESSIBILITY_DOMAIN_SIZES)
+for _domain, _terms in ACCESSIBILITY_DOMAINS.items():
+    for _term in _terms:
+        _TERM_TO_DOMAINS.setdefault(_term.lower(), []).append(_domain)
+for _domain, _terms in TECHNOLOGY_DOMAINS.items():
+    _DOMAIN_SIZES[f"tech_{_domain}"] = TECHNOLOGY_DOMAIN_SIZES[_domain]
+    for _term in _terms:
+        _TERM_TO_DOMAINS.setdefault(_term.lower(), []).append(f"tech_{_domain}")
+_DOMAIN_ORDER = tuple(_DOMAIN_SIZES)
+# A domain's score counts distinct terms, so it never exceeds the domain
+# size; every possible normalised score is precomputed, leaving query-time
+# scoring a table lookup with no division
+_DOMAIN_SCORES = {
+    domain: tuple(score / size for score in range(size + 1))
+    for domain, size in _DOMAIN_SIZES.items()
+}
+_ALL_DOMAIN_TERMS = sorted(_TERM_TO_DOMAINS, key=len, reverse=True)
+_DOMAIN_TERM_RE = re.compile(
+    '(?=(' + '|'.join(map(re.escape, _ALL_DOMAIN_TERMS)) + '))')
+_DOMAIN_TERM_IMPLIES = {
+    term: tuple(other for other in _ALL_DOMAIN_TERMS
+                if other != term and other in term)
+    for term in _ALL_DOMAIN_TERMS
+}
 
 
-@dataclass
-class ConceptExpansion:
+class ConceptExpansion(NamedTuple):
     """Result of concept expansion."""
     original_term: str
     synonyms: List[str]
@@ -42,10 +108,102 @@ class OntologyManager:
         self.ontology_data = {}
         self.concept_index = {}
         self.term_to_concept = {}
-        
-        self._load_ontologies()
-        self._build_indexes()
-    
+
+        # Memoized query results; cleared whenever indexes are rebuilt
+        self._expand_cache: Dict[Tuple[str, int], List[str]] = {}
+        self._domain_cache: Dict[str, List[Tuple[str, float]]] = {}
+
+        if not self._load_cached_indexes():
+            self._load_ontologies()
+            self._build_indexes()
+            self._save_index_cache()
+
+    def _index_cache_file(self) -> Path:
+        """Path of the pickled index cache next to the schema files."""
+        return self.ontology_path / '.built_index.pkl'
+
+    def _schema_fingerprint(self) -> List[Tuple[str, int]]:
+        """Identify the current schema files by name and mtime."""
+        try:
+            return sorted((path.name, path.stat().st_mtime_ns)
+                          for path in self.ontology_path.glob('*.json'))
+        except OSError:
+            return []
+
+    def _load_cached_indexes(self) -> bool:
+        """Restore parsed data and indexes from the pickle cache.
+
+        Returns False when the cache is absent or the schema files have
+        changed since it was written, in which case the caller parses
+        and rebuilds from the JSON sources.
+        """
+        try:
+            with open(self._index_cache_file(), 'rb') as f:
+                cached = pickle.load(f)
+            if cached.get('fingerprint') != self._schema_fingerprint():
+                return False
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            print(f"Error reading ontology index cache: {e}")
+            return False
+
+        self.ontology_data = cached['ontology_data']
+        self.concept_index = cached['concept_index']
+        self.term_to_concept = cached['term_to_concept']
+        self._concept_index_lower = cached['concept_index_lower']
+        self._term_scan_re = cached['term_scan_re']
+        self._term_implies = cached['term_implies']
+        self._multiword_trie = cached['multiword_trie']
+        self._relationships_cache = cached['relationships_cache']
+        self._reverse_index = cached['reverse_index']
+        return True
+
+    def _save_index_cache(self) -> None:
+        """Persist parsed data and indexes so warm starts skip the rebuild."""
+        if not self.ontology_path.exists():
+            return
+
+        payload = {
+            'fingerprint': self._schema_fingerprint(),
+            'ontology_data': self.ontology_data,
+            'concept_index': self.concept_index,
+            'term_to_concept': self.term_to_concept,
+            'concept_index_lower': self._concept_index_lower,
+            'term_scan_re': self._term_scan_re,
+            'term_implies': self._term_implies,
+            'multiword_trie': self._multiword_trie,
+            'relationships_cache': self._relationships_cache,
+            'reverse_index': self._reverse_index,
+        }
+        try:
+            with open(self._index_cache_file(), 'wb') as f:
+                pickle.dump(payload, f, pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            print(f"Error writing ontology index cache: {e}")
+
+    # Shared instances keyed by resolved ontology path; see get()
+    _instances: Dict[str, 'OntologyManager'] = {}
+
+    @classmethod
+    def get(cls, ontology_path: Optional[str] = None) -> 'OntologyManager':
+        """Return a shared instance for the given ontology path.
+
+        Loading parses every schema file and rebuilds all indexes, so
+        callers that just need to query (tests, validation scripts, the
+        retrieval pipeline) should share one instance per path instead
+        of constructing their own.
+        """
+        if ontology_path is None:
+            ontology_path = Path(__file__).parent / "schemas"
+
+        key = str(Path(ontology_path).resolve())
+        instance = cls._instances.get(key)
+        if instance is None:
+            instance = cls(ontology_path)
+            cls._instances[key] = instance
+        return instance
+
     def expand_query_terms(self, query: str, max_expansions: int = 10) -> List[str]:
         """
         Expand query terms using ontology relationships.
@@ -57,30 +215,49 @@ class OntologyManager:
         Returns:
             List of expanded terms
         """
-        query_lower = query.lower()
-        expanded_terms = set()
-        
+        query_lower = _fold(query)
+
+        cache_key = (query_lower, max_expansions)
+        cached = self._expand_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
+
+        # Original query terms never count as expansions
+        query_words = frozenset(query_lower.split())
+
+        # Ordered dict as a seen-set: terms skip the query words inline and
+        # collection stops as soon as the limit is reached, so there is no
+        # full set to subtract or slice afterwards
+        expanded = {}
+
         # Find concepts mentioned in the query
         mentioned_concepts = self._find_mentioned_concepts(query_lower)
-        
+
         for concept in mentioned_concepts:
-            expansion = self._expand_concept(concept)
-            if expansion:
-                # Add synonyms (highest weight)
-                expanded_terms.update(expansion.synonyms[:3])
-                
-                # Add related terms (medium weight)
-                expanded_terms.update(expansion.related_terms[:3])
-                
-                # Add subconcepts (lower weight)
-                expanded_terms.update(expansion.subconcepts[:2])
-        
-        # Remove original query terms to avoid duplication
-        query_words = set(query_lower.split())
-        expanded_terms = expanded_terms - query_words
-        
-        # Convert to list and limit
-        return list(expanded_terms)[:max_expansions]
+            # Read the concept record directly rather than going through
+            # _expand_concept: only three fields matter here and the
+            # wrapper object would be built and discarded per concept
+            concept_data = self.concept_index.get(concept)
+            if concept_data is None:
+                continue
+
+            # Synonyms (highest weight), related terms (medium weight),
+            # then subconcepts (lower weight)
+            for field, limit in (('synonyms', 3),
+                                 ('related_terms', 3),
+                                 ('subconcepts', 2)):
+                for term in concept_data.get(field, ())[:limit]:
+                    if term not in query_words and term not in expanded:
+                        expanded[term] = None
+            if len(expanded) >= max_expansions:
+                break
+
+        result = list(expanded)[:max_expansions]
+
+        if len(self._expand_cache) >= _QUERY_CACHE_MAX:
+            self._expand_cache.pop(next(iter(self._expand_cache)))
+        self._expand_cache[cache_key] = result
+        return list(result)
     
     def get_concept_relationships(self, concept_id: str) -> Dict[str, List[str]]:
         """
@@ -92,23 +269,26 @@ class OntologyManager:
         Returns:
             Dictionary with relationship types and related concepts
         """
-        if concept_id not in self.concept_index:
-            return {}
-        
-        concept_data = self.concept_index[concept_id]
-        relationships = {
-            'synonyms': concept_data.get('synonyms', []),
-            'related_terms': concept_data.get('related_terms', []),
-            'subconcepts': concept_data.get('subconcepts', []),
-            'parent': [concept_data.get('parent')] if concept_data.get('parent') else [],
-            'technologies': concept_data.get('technologies', []),
-            'standards': concept_data.get('standards', []),
-            'wcag_criteria': concept_data.get('wcag_criteria', [])
-        }
-        
-        # Remove empty lists
-        return {k: v for k, v in relationships.items() if v and v != [None]}
-    
+        return self._relationships_cache.get(concept_id, {})
+
+    def get_concept_relationship(self, concept_id: str,
+                                 relationship_type: str) -> Tuple[str, ...]:
+        """
+        Get one relationship of a concept without building the full view.
+
+        Args:
+            concept_id: ID of the concept
+            relationship_type: Relationship name, e.g. 'synonyms'
+
+        Returns:
+            Tuple of related terms, empty when the concept or the
+            relationship is absent
+        """
+        relationships = self._relationships_cache.get(concept_id)
+        if relationships is None:
+            return ()
+        return relationships.get(relationship_type, ())
+
     def find_related_concepts(self, term: str, relationship_types: List[str] = None) -> List[str]:
         """
         Find concepts related to a term.
@@ -123,23 +303,22 @@ class OntologyManager:
         if relationship_types is None:
             relationship_types = ['synonyms', 'related_terms', 'subconcepts']
         
-        term_lower = term.lower()
+        term_lower = _fold(term)
         related_concepts = set()
         
         # Find direct concept match
         concept_id = self.term_to_concept.get(term_lower)
         if concept_id:
-            relationships = self.get_concept_relationships(concept_id)
             for rel_type in relationship_types:
-                if rel_type in relationships:
-                    related_concepts.update(relationships[rel_type])
+                related_concepts.update(
+                    self.get_concept_relationship(concept_id, rel_type))
         
-        # Find concepts that mention this term
-        for concept_id, concept_data in self.concept_index.items():
-            for rel_type in relationship_types:
-                if rel_type in concept_data:
-                    if term_lower in [item.lower() for item in concept_data[rel_type]]:
-                        related_concepts.add(concept_id)
+        # Find concepts that mention this term through the reverse index,
+        # replacing a scan over every concept's relationship fields
+        for rel_type in relationship_types:
+            by_term = self._reverse_index.get(rel_type)
+            if by_term:
+                related_concepts.update(by_term.get(term_lower, ()))
         
         return list(related_concepts)
     
@@ -180,23 +359,37 @@ class OntologyManager:
             List of (domain, confidence) tuples
         """
         query_lower = query.lower()
+
+        cached = self._domain_cache.get(query_lower)
+        if cached is not None:
+            return list(cached)
+
+        # One scan finds every domain term present; counts accumulate per
+        # domain through the inverted index
+        found = {m.group(1) for m in _DOMAIN_TERM_RE.finditer(query_lower)}
+        for term in tuple(found):
+            found.update(_DOMAIN_TERM_IMPLIES[term])
+
+        counts = {}
+        for term in found:
+            for domain in _TERM_TO_DOMAINS[term]:
+                counts[domain] = counts.get(domain, 0) + 1
+
+        # Walk domains in declaration order so equal scores keep the same
+        # tie-break the per-domain loops produced
         domain_scores = {}
-        
-        # Check accessibility domains
-        for domain, terms in ACCESSIBILITY_DOMAINS.items():
-            score = sum(1 for term in terms if term in query_lower)
-            if score > 0:
-                domain_scores[domain] = score / len(terms)
-        
-        # Check technology domains
-        for domain, terms in TECHNOLOGY_DOMAINS.items():
-            score = sum(1 for term in terms if term in query_lower)
+        for domain in _DOMAIN_ORDER:
+            score = counts.get(domain, 0)
             if score > 0:
-                domain_scores[f"tech_{domain}"] = score / len(terms)
-        
+                domain_scores[domain] = _DOMAIN_SCORES[domain][score]
+
         # Sort by score
         sorted_domains = sorted(domain_scores.items(), key=lambda x: x[1], reverse=True)
-        return sorted_domains
+
+        if len(self._domain_cache) >= _QUERY_CACHE_MAX:
+            self._domain_cache.pop(next(iter(self._domain_cache)))
+        self._domain_cache[query_lower] = sorted_domains
+        return list(sorted_domains)
     
     def _load_ontologies(self) -> None:
         """Load all ontology files from the schemas directory."""
@@ -204,14 +397,52 @@ class OntologyManager:
             print(f"Warning: Ontology path {self.ontology_path} does not exist")
             return
         
-        for ontology_file in self.ontology_path.glob("*.json"):
-            try:
-                with open(ontology_file, 'r', encoding='utf-8') as f:
-                    ontology_data = json.load(f)
-                    self.ontology_data[ontology_file.stem] = ontology_data
+        ontology_files = list(self.ontology_path.glob("*.json"))
+
+        # Read and parse files on a small thread pool so one slow disk
+        # read does not serialise the rest; results merge in glob order,
+        # so load output and data layout stay deterministic. A single
+        # file skips the pool entirely.
+        if len(ontology_files) > 1:
+            with ThreadPoolExecutor(
+                    max_workers=min(8, len(ontology_files))) as executor:
+                futures = [(path, executor.submit(self._parse_ontology_file, path))
+                           for path in ontology_files]
+                for ontology_file, future in futures:
+                    try:
+                        self.ontology_data[ontology_file.stem] = future.result()
+                        print(f"Loaded ontology: {ontology_file.stem}")
+                    except Exception as e:
+                        print(f"Error loading ontology {ontology_file}: {e}")
+        else:
+            for ontology_file in ontology_files:
+                try:
+                    self.ontology_data[ontology_file.stem] = \
+                        self._parse_ontology_file(ontology_file)
                     print(f"Loaded ontology: {ontology_file.stem}")
-            except Exception as e:
-                print(f"Error loading ontology {ontology_file}: {e}")
+                except Exception as e:
+                    print(f"Error loading ontology {ontology_file}: {e}")
+
+    @staticmethod
+    def _parse_ontology_file(ontology_file: Path) -> Dict:
+        """Read and parse one schema file.
+
+        orjson's C parser cuts cold-start parse time when it is installed;
+        the stdlib parser handles the same bytes otherwise. Large files
+        are memory-mapped so the parser reads the page cache directly
+        rather than through an intermediate copy.
+        """
+        with open(ontology_file, 'rb') as f:
+            if orjson is not None and \
+                    os.fstat(f.fileno()).st_size >= _MMAP_PARSE_MIN:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    view = memoryview(mm)
+                    try:
+                        return orjson.loads(view)
+                    finally:
+                        view.release()
+            raw = f.read()
+        return orjson.loads(raw) if orjson else json.loads(raw)
     
     def _build_indexes(self) -> None:
         """Build search indexes from loaded ontologies."""
@@ -219,45 +450,139 @@ class OntologyManager:
             # Index concepts
             if 'concepts' in ontology_data:
                 for concept_id, concept_info in ontology_data['concepts'].items():
+                    # Concept ids repeat across every index and result
+                    # list, so interned copies share one string object
+                    concept_id = sys.intern(concept_id)
                     self.concept_index[concept_id] = concept_info
-                    
+
                     # Index terms to concepts
-                    self.term_to_concept[concept_id.lower()] = concept_id
-                    self.term_to_concept[concept_info.get('label', '').lower()] = concept_id
-                    
+                    self.term_to_concept[_fold(concept_id)] = concept_id
+                    self.term_to_concept[_fold(concept_info.get('label', ''))] = concept_id
+
                     # Index synonyms
                     for synonym in concept_info.get('synonyms', []):
-                        self.term_to_concept[synonym.lower()] = concept_id
-            
+                        self.term_to_concept[_fold(synonym)] = concept_id
+
             # Index technologies
             if 'technologies' in ontology_data:
                 for tech_id, tech_info in ontology_data['technologies'].items():
+                    tech_id = sys.intern(tech_id)
                     self.concept_index[tech_id] = tech_info
-                    self.term_to_concept[tech_id.lower()] = tech_id
-                    self.term_to_concept[tech_info.get('label', '').lower()] = tech_id
-                    
+                    self.term_to_concept[_fold(tech_id)] = tech_id
+                    self.term_to_concept[_fold(tech_info.get('label', ''))] = tech_id
+
                     # Index examples/instances
                     for example in tech_info.get('examples', []):
-                        self.term_to_concept[example.lower()] = tech_id
-    
+                        self.term_to_concept[_fold(example)] = tech_id
+
+        # Fold every list-valued relationship field once, so lookups never
+        # re-normalise stored strings on the query path
+        self._concept_index_lower = {}
+        for concept_id, concept_data in self.concept_index.items():
+            self._concept_index_lower[concept_id] = {
+                key: tuple(_fold(item) for item in value)
+                for key, value in concept_data.items()
+                if isinstance(value, list)
+            }
+
+        # Reverse index over the folded relationship fields: for each
+        # field name, which concepts list a given term. Lets term lookups
+        # resolve mentioning concepts without scanning the whole index
+        self._reverse_index = {}
+        for concept_id, lowered in self._concept_index_lower.items():
+            for field, items in lowered.items():
+                by_term = self._reverse_index.setdefault(field, {})
+                for item in items:
+                    by_term.setdefault(item, set()).add(concept_id)
+
+        self._build_term_scanner()
+
+        # Relationship views never change between rebuilds, so they are
+        # computed once here instead of per lookup. Tuples keep the stored
+        # views immutable across the shared instance.
+        self._relationships_cache = {}
+        for concept_id, concept_data in self.concept_index.items():
+            relationships = {
+                'synonyms': tuple(concept_data.get('synonyms', ())),
+                'related_terms': tuple(concept_data.get('related_terms', ())),
+                'subconcepts': tuple(concept_data.get('subconcepts', ())),
+                'parent': (concept_data.get('parent'),) if concept_data.get('parent') else (),
+                'technologies': tuple(concept_data.get('technologies', ())),
+                'standards': tuple(concept_data.get('standards', ())),
+                'wcag_criteria': tuple(concept_data.get('wcag_criteria', ()))
+            }
+            self._relationships_cache[concept_id] = {
+                k: v for k, v in relationships.items() if v
+            }
+
+        # Any rebuild invalidates memoized query results
+        self._expand_cache.clear()
+        self._domain_cache.clear()
+
+    def _build_term_scanner(self) -> None:
+        """Compile one multi-term pattern over every indexed term.
+
+        A lookahead alternation tests every query position, so one linear
+        scan finds each occurrence of each term instead of one substring
+        search per term. The alternation is longest-first, so a shorter
+        term starting where a longer one matched is recovered through the
+        containment table rather than a second scan.
+        """
+        terms = sorted((term for term in self.term_to_concept if term),
+                       key=len, reverse=True)
+        if terms:
+            self._term_scan_re = re.compile(
+                '(?=(' + '|'.join(map(re.escape, terms)) + '))')
+        else:
+            self._term_scan_re = None
+        self._term_implies = {
+            term: tuple(other for other in terms if other != term and other in term)
+            for term in terms
+        }
+
+        # Word-level trie over multi-word terms: a dict-of-dicts keyed by
+        # token, with the concept id stored under None at terminal nodes.
+        # Matching walks the query tokens once instead of bag-of-words
+        # checking every multi-word term against the query
+        self._multiword_trie = {}
+        for term, concept_id in self.term_to_concept.items():
+            words = term.split()
+            if len(words) > 1:
+                node = self._multiword_trie
+                for word in words:
+                    node = node.setdefault(word, {})
+                node[None] = concept_id
+
     def _find_mentioned_concepts(self, query: str) -> List[str]:
         """Find concepts mentioned in the query."""
         mentioned = []
-        
-        # Direct term matches
-        for term, concept_id in self.term_to_concept.items():
-            if term in query:
-                mentioned.append(concept_id)
-        
-        # Fuzzy matches for multi-word terms
-        query_words = query.split()
-        for term, concept_id in self.term_to_concept.items():
-            term_words = term.split()
-            if len(term_words) > 1:
-                # Check if all words of the term appear in the query
-                if all(word in query_words for word in term_words):
-                    mentioned.append(concept_id)
-        
+
+        # Direct term matches: one scan of the query finds every term,
+        # replacing a substring check per indexed term
+        if self._term_scan_re is not None:
+            found = {m.group(1) for m in self._term_scan_re.finditer(query)}
+            for term in tuple(found):
+                found.update(self._term_implies[term])
+            mentioned.extend(self.term_to_concept[term] for term in found)
+
+        # An empty indexed term matches any query, as `'' in query` did
+        if '' in self.term_to_concept:
+            mentioned.append(self.term_to_concept[''])
+
+        # Multi-word terms: walk the trie forward from every token position,
+        # so terms match as ordered phrases rather than bags of words
+        if self._multiword_trie:
+            query_words = query.split()
+            for start in range(len(query_words)):
+                node = self._multiword_trie
+                for word in query_words[start:]:
+                    node = node.get(word)
+                    if node is None:
+                        break
+                    concept_id = node.get(None)
+                    if concept_id is not None:
+                        mentioned.append(concept_id)
+
         return list(set(mentioned))
     
     def _expand_concept(self, concept_id: str) -> Optional[ConceptExpansion]:
@@ -295,17 +620,35 @@ class OntologyManager:
     
     def validate_ontology_consistency(self) -> List[str]:
         """Validate ontology for consistency issues."""
-        issues = []
-        
-        # Check for broken parent relationships
+        known = self.concept_index.keys()
+
+        # Collect every referenced id first, then resolve them against the
+        # index with set lookups; only the broken references get formatted
+        parent_refs = []
+        subconcept_refs = []
         for concept_id, concept_data in self.concept_index.items():
             parent = concept_data.get('parent')
-            if parent and parent not in self.concept_index:
-                issues.append(f"Concept {concept_id} references unknown parent: {parent}")
-            
-            # Check subconcepts
+            if parent:
+                parent_refs.append((concept_id, parent))
             for subconcept in concept_data.get('subconcepts', []):
-                if subconcept not in self.concept_index:
-                    issues.append(f"Concept {concept_id} references unknown subconcept: {subconcept}")
-        
-        return issues
\ No newline at end of file
+                subconcept_refs.append((concept_id, subconcept))
+
+        issues = [
+            f"Concept {concept_id} references unknown parent: {parent}"
+            for concept_id, parent in parent_refs if parent not in known
+        ]
+        issues.extend(
+            f"Concept {concept_id} references unknown subconcept: {subconcept}"
+            for concept_id, subconcept in subconcept_refs if subconcept not in known
+        )
+        return issues
+
+
+def get_default_ontology() -> OntologyManager:
+    """Return the shared manager for the bundled schema directory.
+
+    Convenience for the common case of OntologyManager.get(); the shared
+    registry already guarantees one parse per path, so this adds no cache
+    of its own.
+    """
+    return OntologyManager.get()
\ No newline at end of file
@@ -13,7 +13,7 @@ from document_management.document_classifier import DocumentClassifier, Classifi
 from document_management.authority_mapper import AuthorityMapper
 from document_management.content_analyzer import ContentAnalyzer
 from document_management.metadata_schema import DocumentMetadata, MetadataManager
-from ontology.ontology_manager import OntologyManager
+from ontology.ontology_manager import OntologyManager, get_default_ontology
 from config.constants import DocumentType, AuthorityLevel
 
 
@@ -97,7 +97,7 @@ def test_ontology_manager():
     """Test ontology management system."""
     print("Testing Ontology Manager...")
     
-    ontology = OntologyManager()
+    ontology = get_default_ontology()
     
     # Test query expansion
     query = "screen reader accessibility"
@@ -22,8 +22,8 @@ def test_imports():
         
         # Test ontology components
         print("\nTesting ontology components...")
-        from ontology.ontology_manager import OntologyManager
-        ontology = OntologyManager()
+        from ontology.ontology_manager import get_default_ontology
+        ontology = get_default_ontology()
         stats = ontology.get_ontology_stats()
         print(f"✅ Ontology manager working - {stats.get('total_concepts', 0)} concepts loaded")
         
@@ -138,9 +138,9 @@ def test_classification_example():
 def test_ontology_expansion():
     """Test ontology-based query expansion."""
     try:
-        from ontology.ontology_manager import OntologyManager
-        
-        ontology = OntologyManager()
+        from ontology.ontology_manager import get_default_ontology
+
+        ontology = get_default_ontology()
         
         test_queries = [
             "screen reader accessibility",